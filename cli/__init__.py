@@ -1,7 +1,25 @@
 """Terminal Client for LinkedIn Job Application Agent"""
 
-from cli.client import JobApplicationCLI
-from cli.config import CLIConfig, JobSearchConfig
-from cli.ui import TerminalUI
+import importlib
+
+# Public names are resolved lazily so `import cli` does not load typer/rich/etc.
+_LAZY = {
+    "JobApplicationCLI": "cli.client",
+    "CLIConfig": "cli.config",
+    "JobSearchConfig": "cli.config",
+    "TerminalUI": "cli.ui",
+}
 
 __all__ = ["JobApplicationCLI", "CLIConfig", "JobSearchConfig", "TerminalUI"]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
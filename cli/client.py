@@ -1,5 +1,7 @@
 """Main CLI client for the LinkedIn Job Application Agent."""
 
+import argparse
+import functools
 import json
 import os
 import sys
@@ -8,66 +10,101 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import typer
-from dotenv import load_dotenv
-from loguru import logger
-from rich.console import Console
-
 from cli.config import CLIConfig, JobSearchConfig
-from cli.ui import TerminalUI
-from src.core.agent import JobApplicationAgent
-from src.core.utils.logging_config import (
-    configure_core_agent_logging,
-    log_core_agent_completion,
-    log_core_agent_startup,
+
+COMMANDS = {
+    "run": "Run the job application workflow.",
+    "init": "Initialize a new configuration file.",
+    "validate": "Validate a configuration file.",
+    "test-connection": "Test connection to MCP server.",
+}
+EXCLUDED_STATE_KEYS = frozenset({"cv_content"})
+SEARCH_REQUEST_FIELDS = frozenset({"job_title", "location", "monthly_salary", "limit"})
+APP_HELP = (
+    "LinkedIn Job Application Agent - Automated job search and application system"
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> str:
+    """Resolve the default configuration file path once per process."""
+    return CLIConfig().get_default_config_path()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_file(config_file: str, mtime: float) -> CLIConfig:
+    """Parse a configuration file, reusing the result while its mtime is unchanged."""
+    return CLIConfig.load_from_file(config_file)
+
+
+@functools.lru_cache(maxsize=4)
+def _make_ui(output_format: str) -> "TerminalUI":
+    """Create one TerminalUI per output format, importing Rich on first use."""
+    from cli.ui import TerminalUI
+
+    return TerminalUI(output_format)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logger():
+    """Return the core agent logger bound to a single trace_id for this CLI run."""
+    from src.core.utils.logging_config import get_core_agent_logger
+
+    return get_core_agent_logger(str(uuid.uuid4()))
+
+
+def _load_env() -> None:
+    """Load the .env file unless JOB_APPLIER_SKIP_DOTENV=1 (env already injected)."""
+    if os.environ.get("JOB_APPLIER_SKIP_DOTENV") == "1":
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, default=str).encode()
+
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    )
+
+
 class JobApplicationCLI:
     """Command-line interface for the LinkedIn Job Application Agent."""
 
     def __init__(self):
-        # Load .env file if it exists
-        load_dotenv()
-
-        # Configure core agent logging
-        configure_core_agent_logging()
-
-        self.app = typer.Typer(
-            name="job-applier",
-            help="LinkedIn Job Application Agent - Automated job search and application system",
-            no_args_is_help=True,
-            rich_markup_mode=None,  # Disable rich formatting
-        )
+        # Heavy imports (agent graph, dotenv, logging config) are deferred to the
+        # commands that need them so `--help` and `validate` start fast.
+        self.parser = self._build_parser()
         self.ui = None
         self.config = None
 
-        # Register commands
-        self._register_commands()
-
-    def _register_commands(self):
-        """Register all CLI commands."""
-
-        @self.app.command("run")
-        def run_workflow():
-            """Run the job application workflow."""
+    @staticmethod
+    def _build_parser() -> argparse.ArgumentParser:
+        """Build the stdlib argument parser for the CLI commands."""
+        parser = argparse.ArgumentParser(prog="job-applier", description=APP_HELP)
+        subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+        for name, help_text in COMMANDS.items():
+            subparsers.add_parser(name, help=help_text, description=help_text)
+        return parser
+
+    def _dispatch(self, command: str):
+        """Run the handler for a parsed command."""
+        if command == "run":
             self._run_workflow_command(
                 None, None, None, None, "localhost", 3000, "rich", True, False
             )
-
-        @self.app.command("init")
-        def init_config():
-            """Initialize a new configuration file."""
+        elif command == "init":
             self._init_config_command(None, True)
-
-        @self.app.command("validate")
-        def validate_config():
-            """Validate a configuration file."""
+        elif command == "validate":
             self._validate_config_command(None)
-
-        @self.app.command("test-connection")
-        def test_connection():
-            """Test connection to MCP server."""
+        elif command == "test-connection":
             self._test_connection_command("localhost", 3000)
 
     def _run_workflow_command(
@@ -83,9 +120,12 @@ class JobApplicationCLI:
         interactive: bool,
     ):
         """Execute the run workflow command."""
+        _load_env()
+        logger = _get_logger()
+
         try:
             # Initialize UI
-            self.ui = TerminalUI(output_format)
+            self.ui = _make_ui(output_format)
             self.ui.print_header()
             self.ui.start_timer()
 
@@ -128,23 +168,26 @@ class JobApplicationCLI:
             self._execute_workflow()
 
         except KeyboardInterrupt:
-            self.ui.console.print("\\n❌ Workflow interrupted by user", style="red")
+            if self.ui:
+                self.ui.console.print("\n❌ Workflow interrupted by user", style="red")
             sys.exit(1)
         except Exception as e:
-            self.ui.console.print(f"❌ Workflow failed: {str(e)}", style="red")
+            # The UI may not exist yet if the failure happened while creating it
+            if self.ui:
+                self.ui.console.print(f"❌ Workflow failed: {str(e)}", style="red")
             logger.exception("Workflow execution failed")
             sys.exit(1)
 
     def _init_config_command(self, config_file: Optional[str], interactive: bool):
         """Execute the init config command."""
-        self.ui = TerminalUI("rich")
+        self.ui = _make_ui("rich")
 
         if not config_file:
-            config_file = CLIConfig().get_default_config_path()
+            config_file = _default_config_path()
 
         # Check if config file already exists
-        if os.path.exists(config_file):
-            overwrite = typer.confirm(
+        if Path(config_file).is_file():
+            overwrite = self._confirm(
                 f"Configuration file {config_file} already exists. Overwrite?"
             )
             if not overwrite:
@@ -164,10 +207,12 @@ class JobApplicationCLI:
 
     def _validate_config_command(self, config_file: Optional[str]):
         """Execute the validate config command."""
-        self.ui = TerminalUI("rich")
+        _load_env()
+
+        self.ui = _make_ui("rich")
 
         if not config_file:
-            config_file = CLIConfig().get_default_config_path()
+            config_file = _default_config_path()
 
         try:
             config = CLIConfig.load_from_file(config_file)
@@ -192,13 +237,17 @@ class JobApplicationCLI:
 
     def _test_connection_command(self, mcp_host: str, mcp_port: int):
         """Execute the test connection command."""
-        self.ui = TerminalUI("rich")
+        _load_env()
+
+        self.ui = _make_ui("rich")
 
         self.ui.console.print(
             f"Testing connection to MCP server at {mcp_host}:{mcp_port}..."
         )
 
         try:
+            from src.core.agent import JobApplicationAgent
+
             # Try to create agent and test connection
             agent = JobApplicationAgent(server_host=mcp_host, server_port=mcp_port)
             self.ui.console.print("✅ Connection successful", style="green")
@@ -219,51 +268,44 @@ class JobApplicationCLI:
         save_results: bool,
     ) -> CLIConfig:
         """Load and merge configuration from various sources."""
-
-        # Start with defaults
-        config = CLIConfig(
-            mcp_server_host=mcp_host,
-            mcp_server_port=mcp_port,
-            output_format=output_format,
-            save_results=save_results if save_results is not None else True,
-        )
+        overrides: Dict[str, Any] = {
+            "mcp_server_host": mcp_host,
+            "mcp_server_port": mcp_port,
+            "output_format": output_format,
+            "save_results": save_results if save_results is not None else True,
+        }
 
         # Load from config file if provided, or try to find default
-        if not config_file:
-            # Try to find a default config file
-            default_config = CLIConfig().get_default_config_path()
-            if os.path.exists(default_config):
-                config_file = default_config
+        candidate = config_file or _default_config_path()
+        try:
+            file_config = _load_config_file(candidate, os.stat(candidate).st_mtime)
+        except FileNotFoundError:
+            file_config = None
 
-        if config_file and os.path.exists(config_file):
-            file_config = CLIConfig.load_from_file(config_file)
+        if file_config is not None:
             # Merge file config with defaults
-            config = file_config.copy(
-                update={
-                    "mcp_server_host": mcp_host,
-                    "mcp_server_port": mcp_port,
-                    "output_format": output_format,
-                    "save_results": save_results,
-                }
-            )
-        elif config_file:
-            self.ui.console.print(
-                f"⚠️  Configuration file {config_file} not found, using defaults",
-                style="yellow",
-            )
+            config = file_config.copy(update=overrides)
+        else:
+            if config_file:
+                self.ui.console.print(
+                    f"⚠️  Configuration file {config_file} not found, using defaults",
+                    style="yellow",
+                )
+            config = CLIConfig(**overrides)
 
         # Override with environment variables
         config = config.merge_with_env()
 
-        # Override with command line arguments
+        # Override with command line arguments in a single copy
+        cli_overrides: Dict[str, str] = {}
         if linkedin_email:
-            config.linkedin_email = linkedin_email
+            cli_overrides["linkedin_email"] = linkedin_email
         if linkedin_password:
-            config.linkedin_password = linkedin_password
+            cli_overrides["linkedin_password"] = linkedin_password
         if cv_file:
-            config.cv_file_path = cv_file
+            cli_overrides["cv_file_path"] = cv_file
 
-        return config
+        return config.copy(update=cli_overrides) if cli_overrides else config
 
     def _interactive_job_search_setup(self):
         """Interactive setup for job search criteria."""
@@ -294,7 +336,7 @@ class JobApplicationCLI:
                     f"✅ Added job search: {job_title} in {location}", style="green"
                 )
 
-                if not typer.confirm("Add another job search?"):
+                if not self._confirm("Add another job search?"):
                     break
 
             except ValueError as e:
@@ -342,30 +384,23 @@ class JobApplicationCLI:
         )
 
     def _setup_logging(self):
-        """Setup logging configuration."""
-        logger.remove()  # Remove default handler
-
-        # Console logging
-        if self.config.output_format != "json":
-            logger.add(
-                sys.stderr,
-                level=self.config.log_level,
-                format="<green>{time}</green> | <level>{level}</level> | {message}",
-                filter=lambda record: self.config.output_format
-                != "rich",  # Only log in simple mode
-            )
-
-        # File logging
-        if self.config.log_file:
-            logger.add(
-                self.config.log_file,
-                level=self.config.log_level,
-                format="{time} | {level} | {message}",
-                rotation="10 MB",
-            )
+        """Setup logging configuration once the run configuration is resolved."""
+        from src.core.utils.logging_config import configure_core_agent_logging
+
+        # Replaces any previously installed handlers. Only simple output logs
+        # to the console; JSON and rich output keep stderr/stdout to themselves.
+        configure_core_agent_logging(
+            log_level=self.config.log_level,
+            log_file=self.config.log_file,
+            console=self.config.output_format == "simple",
+        )
 
     def _execute_workflow(self):
         """Execute the main job application workflow."""
+        from src.core.agent import JobApplicationAgent
+
+        logger = _get_logger()
+
         try:
             # Initialize the agent
             agent = JobApplicationAgent(
@@ -375,12 +410,7 @@ class JobApplicationCLI:
 
             # Prepare job search requests
             job_search_requests = [
-                {
-                    "job_title": search.job_title,
-                    "location": search.location,
-                    "monthly_salary": search.monthly_salary,
-                    "limit": search.limit,
-                }
+                search.model_dump(include=SEARCH_REQUEST_FIELDS)
                 for search in self.config.job_searches
             ]
 
@@ -432,24 +462,33 @@ class JobApplicationCLI:
 
     def _handle_workflow_results(self, final_state: Dict[str, Any]):
         """Handle and display workflow results."""
+        logger = _get_logger()
+        ui = self.ui
+        get = final_state.get
+
         # Display CV analysis
-        if final_state.get("cv_analysis"):
-            self.ui.print_cv_analysis(final_state["cv_analysis"])
+        cv_analysis = get("cv_analysis")
+        if cv_analysis:
+            ui.print_cv_analysis(cv_analysis)
 
         # Display job results
-        if final_state.get("all_found_jobs"):
-            self.ui.print_job_results(final_state["all_found_jobs"])
+        all_found_jobs = get("all_found_jobs")
+        if all_found_jobs:
+            ui.print_job_results(all_found_jobs)
 
         # Display application results
-        if final_state.get("application_results"):
-            self.ui.print_application_results(final_state["application_results"])
+        application_results = get("application_results")
+        if application_results:
+            ui.print_application_results(application_results)
 
         # Display errors
-        if final_state.get("errors"):
-            self.ui.print_errors(final_state["errors"])
+        errors = get("errors")
+        if errors:
+            ui.print_errors(errors)
 
         # Display final summary
-        self.ui.print_final_summary(final_state)
+        ui.print_final_summary(final_state)
+        ui.flush_json()
 
         # Save results if configured
         if self.config.save_results:
@@ -471,21 +510,33 @@ class JobApplicationCLI:
 
             # Clean up state for JSON serialization
             clean_state = {
-                k: v for k, v in final_state.items() if k not in ["cv_content"]
+                k: v for k, v in final_state.items() if k not in EXCLUDED_STATE_KEYS
             }
 
             # Save to file
-            with open(filepath, "w") as f:
-                json.dump(clean_state, f, indent=2, default=str)
+            with open(filepath, "wb") as f:
+                f.write(_dump_json(clean_state))
 
             self.ui.console.print(f"📁 Results saved to {filepath}", style="blue")
 
         except Exception as e:
-            logger.warning(f"Failed to save results: {str(e)}")
+            logger = _get_logger()
+            logger.warning("Failed to save results: {}", e)
             self.ui.console.print(
                 f"⚠️  Failed to save results: {str(e)}", style="yellow"
             )
 
+    def _confirm(self, message: str) -> bool:
+        """Ask the user a yes/no question."""
+        from rich.prompt import Confirm
+
+        return Confirm.ask(message, console=self.ui.console)
+
     def run(self):
         """Run the CLI application."""
-        self.app()
+        args = self.parser.parse_args()
+        if args.command is None:
+            self.parser.print_help()
+            return
+
+        self._dispatch(args.command)
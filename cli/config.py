@@ -58,11 +58,13 @@ class CLIConfig(BaseModel):
     @classmethod
     def load_from_file(cls, config_path: str) -> "CLIConfig":
         """Load configuration from YAML file."""
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        try:
+            with open(config_path, "r") as f:
+                data = yaml.safe_load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {config_path}"
+            ) from None
 
         # Convert job_searches to JobSearchConfig objects
         if "job_searches" in data:
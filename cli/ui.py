@@ -1,54 +1,176 @@
 """Rich terminal UI components for the CLI client."""
 
 import json
-import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from rich.console import Console
-from rich.layout import Layout
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
-from rich.table import Table
-from rich.text import Text
-from rich.tree import Tree
+import sys
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+try:
+    import orjson
+
+    def _dump_json(data: Any) -> bytes:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        )
+
+except ImportError:
+
+    def _dump_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode()
+
+
+# Status labels shared by the rich and simple output variants
+NO_JOBS_FOUND = "❌ No jobs found"
+NO_APPLICATIONS = "❌ No applications submitted"
+ERRORS_HEADER = "\n❌ Errors encountered:"
+APPLICATION_SUCCESS = "✅ SUCCESS"
+APPLICATION_FAILED = "❌ FAILED"
+
+# Final-state keys left out of the JSON summary
+_JSON_EXCLUDED_KEYS = frozenset({"cv_content"})
+
+# Rich is imported inside the methods that render with it, so JSON output
+# never loads it.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Truncate text to limit characters, appending an ellipsis if cut."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+@lru_cache(maxsize=64)
+def _build_prompt(message: str, default: Optional[str]) -> str:
+    """Build the input prompt for a message and optional default."""
+    return f"{message} [{default}]: " if default else f"{message}: "
+
+
+def _head(items, n: int):
+    """Return the first n items and how many were left out."""
+    items = list(items)
+    return items[:n], max(len(items) - n, 0)
+
+
+def _add_rows_bulk(table: "Table", rows: List[tuple]):
+    """Add pre-built rows to a table."""
+    add = table.add_row
+    for row in rows:
+        add(*row)
 
 
 class TerminalUI:
     """Rich terminal UI for the job application workflow."""
 
+    _FORMATTED_METHODS = (
+        "print_header",
+        "print_config_summary",
+        "print_job_searches",
+        "show_workflow_progress",
+        "print_cv_analysis",
+        "print_job_results",
+        "print_application_results",
+        "print_final_summary",
+        "print_errors",
+    )
+
     def __init__(self, output_format: str = "rich"):
-        self.console = Console()
         self.output_format = output_format
         self.start_time = None
+        self._console: Optional["Console"] = None
+        self._line_buffer: List[Any] = []
+        self._json_chunks: List[bytes] = []
+        self._progress_layout = None
+        self._progress: Optional["Progress"] = None
+
+        # The format is fixed for the lifetime of the UI, so bind each print_*
+        # method to its format-specific variant once instead of branching per call.
+        variant = output_format if output_format in ("json", "rich") else "simple"
+        for name in self._FORMATTED_METHODS:
+            setattr(self, name, getattr(self, f"_{name}_{variant}"))
+
+    @property
+    def console(self) -> "Console":
+        """Rich console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def write(self, *renderables: Any):
+        """Queue renderables to be printed on the next flush()."""
+        self._line_buffer.extend(renderables)
+
+    def flush(self):
+        """Print all queued renderables in a single console render pass."""
+        if not self._line_buffer:
+            return
 
-    def print_header(self):
-        """Print application header."""
-        if self.output_format != "rich":
+        from rich.console import Group
+
+        self.console.print(Group(*self._line_buffer))
+        self._line_buffer.clear()
+
+    def _write_plain(self, lines: List[str], blank_line: bool = True):
+        """Write a simple-format section to stdout in one call, bypassing Rich."""
+        sys.stdout.write("\n".join(lines) + ("\n\n" if blank_line else "\n"))
+
+    def flush_json(self):
+        """Write all queued JSON documents to stdout in a single write."""
+        if not self._json_chunks:
             return
 
-        header_text = Text("LinkedIn Job Application Agent", style="bold blue")
-        header_text.append(" 🤖", style="bold yellow")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"".join(self._json_chunks))
+        sys.stdout.buffer.flush()
+        self._json_chunks.clear()
+
+    def _skip(self, *args: Any, **kwargs: Any):
+        """Output variant for sections a format does not display."""
+
+    def _queue_json(self, data: Any):
+        """Queue a JSON document for flush_json()."""
+        self._json_chunks.append(_dump_json(data) + b"\n")
+
+    def _elapsed_suffix(self) -> str:
+        """Execution time suffix for the final summary."""
+        if self.start_time is None:
+            return ""
+        elapsed = (perf_counter_ns() - self.start_time) / 1e9
+        return f" (Completed in {elapsed:.1f}s)"
+
+    # Header
+
+    _print_header_json = _print_header_simple = _skip
+
+    def _print_header_rich(self):
+        """Print application header."""
+        from rich.panel import Panel
+        from rich.text import Text
+
+        header_text = Text.assemble(
+            ("LinkedIn Job Application Agent", "bold blue"), (" 🤖", "bold yellow")
+        )
 
         panel = Panel(
             header_text,
             subtitle="Automated job search and application system",
             border_style="blue",
         )
-        self.console.print(panel)
-        self.console.print()
+        self.write(panel, "")
+        self.flush()
 
-    def print_config_summary(self, config):
-        """Print configuration summary."""
-        if self.output_format == "json":
-            return
+    # Configuration summary
+
+    _print_config_summary_json = _skip
+
+    def _print_config_summary_rich(self, config):
+        """Print configuration summary as a table."""
+        from rich.table import Table
 
         table = Table(
             title="Configuration Summary", show_header=True, header_style="bold magenta"
@@ -63,23 +185,40 @@ class TerminalUI:
         table.add_row("LinkedIn Email", config.linkedin_email)
         table.add_row("Job Searches", str(len(config.job_searches)))
 
-        if self.output_format == "rich":
-            self.console.print(table)
-        else:
-            # Simple format
-            self.console.print("Configuration:")
-            self.console.print(
-                f"  MCP Server: {config.mcp_server_host}:{config.mcp_server_port}"
+        self.write(table, "")
+        self.flush()
+
+    def _print_config_summary_simple(self, config):
+        """Print configuration summary as plain lines."""
+        lines = [
+            "Configuration:",
+            f"  MCP Server: {config.mcp_server_host}:{config.mcp_server_port}",
+            f"  CV File: {config.cv_file_path}",
+            f"  Job Searches: {len(config.job_searches)}",
+        ]
+        self._write_plain(lines)
+
+    # Job searches
+
+    _print_job_searches_json = _skip
+
+    @staticmethod
+    def _job_search_rows(job_searches: List[Dict]) -> List[tuple]:
+        """Build (title, location, salary, limit) rows for job searches."""
+        fmt_salary = "${:,}/month".format
+        return [
+            (
+                search.job_title,
+                search.location,
+                fmt_salary(search.monthly_salary),
+                str(search.limit),
             )
-            self.console.print(f"  CV File: {config.cv_file_path}")
-            self.console.print(f"  Job Searches: {len(config.job_searches)}")
+            for search in job_searches
+        ]
 
-        self.console.print()
-
-    def print_job_searches(self, job_searches: List[Dict]):
-        """Print job search configurations."""
-        if self.output_format == "json":
-            return
+    def _print_job_searches_rich(self, job_searches: List[Dict]):
+        """Print job search configurations as a table."""
+        from rich.table import Table
 
         table = Table(
             title="Job Search Criteria", show_header=True, header_style="bold magenta"
@@ -88,100 +227,121 @@ class TerminalUI:
         table.add_column("Location", style="green")
         table.add_column("Salary", style="yellow")
         table.add_column("Limit", style="blue")
+        _add_rows_bulk(table, self._job_search_rows(job_searches))
+
+        self.write(table, "")
+        self.flush()
+
+    def _print_job_searches_simple(self, job_searches: List[Dict]):
+        """Print job search configurations as plain lines."""
+        lines = ["Job Search Criteria:"]
+        for i, (title, location, salary, limit) in enumerate(
+            self._job_search_rows(job_searches), 1
+        ):
+            lines.append(f"  {i}. {title} in {location} ({salary}, limit: {limit})")
+        self._write_plain(lines)
+
+    def create_progress_display(self) -> "Progress":
+        """Return the progress display for the workflow, shared across phases."""
+        if self._progress is None:
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                TimeElapsedColumn,
+            )
 
-        for search in job_searches:
-            table.add_row(
-                search.job_title,
-                search.location,
-                f"${search.monthly_salary:,}/month",
-                str(search.limit),
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+                console=self.console,
             )
+        return self._progress
 
-        if self.output_format == "rich":
-            self.console.print(table)
-        else:
-            self.console.print("Job Search Criteria:")
-            for i, search in enumerate(job_searches, 1):
-                self.console.print(
-                    f"  {i}. {search.job_title} in {search.location} (${search.monthly_salary:,}/month, limit: {search.limit})"
-                )
-
-        self.console.print()
-
-    def create_progress_display(self) -> Progress:
-        """Create a progress display for the workflow."""
-        return Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console,
-            transient=False,
-        )
+    def reset_progress(self):
+        """Remove all tasks from the shared progress display."""
+        if self._progress is None:
+            return
+
+        for task_id in list(self._progress.task_ids):
+            self._progress.remove_task(task_id)
 
-    def show_workflow_progress(self, agent_state: Dict[str, Any]):
+    # Workflow progress
+
+    def _show_workflow_progress_simple(self, agent_state: Dict[str, Any]):
+        """Show workflow status as a plain line."""
+        self.console.print(f"Status: {agent_state.get('current_status', 'Unknown')}")
+
+    _show_workflow_progress_json = _show_workflow_progress_simple
+
+    def _show_workflow_progress_rich(self, agent_state: Dict[str, Any]):
         """Show live workflow progress."""
-        if self.output_format != "rich":
-            # Simple text output
-            self.console.print(
-                f"Status: {agent_state.get('current_status', 'Unknown')}"
-            )
-            return
+        from rich.text import Text
 
-        # Create layout
-        layout = Layout()
-        layout.split_column(
-            Layout(name="status", size=3),
-            Layout(name="details"),
-        )
+        if self._progress_layout is None:
+            self._build_progress_layout()
 
-        # Status panel
-        status = agent_state.get("current_status", "Starting...")
-        status_panel = Panel(
-            Text(status, style="bold green"),
-            title="Current Status",
-            border_style="green",
-        )
-        layout["status"].update(status_panel)
+        get = agent_state.get
+        self._status_text.plain = get("current_status", "Starting...")
 
         # Details panel
-        details_text = Text()
-
-        if agent_state.get("total_jobs_found"):
-            details_text.append(
-                f"📍 Jobs Found: {agent_state['total_jobs_found']}\n", style="blue"
+        parts = []
+        if get("total_jobs_found"):
+            parts += (self._jobs_found_prefix, (f"{get('total_jobs_found')}\n", "blue"))
+        if get("filtered_jobs"):
+            parts += (
+                self._filtered_prefix,
+                (f"{len(get('filtered_jobs'))}\n", "green"),
             )
-
-        if agent_state.get("filtered_jobs"):
-            details_text.append(
-                f"✅ Jobs Filtered: {len(agent_state['filtered_jobs'])}\n",
-                style="green",
+        if get("total_jobs_applied"):
+            parts += (
+                self._applied_prefix,
+                (f"{get('total_jobs_applied')}\n", "yellow"),
             )
+        if get("errors"):
+            parts += (self._errors_prefix, (f"{len(get('errors'))}\n", "red"))
 
-        if agent_state.get("total_jobs_applied"):
-            details_text.append(
-                f"🎯 Applications Submitted: {agent_state['total_jobs_applied']}\n",
-                style="yellow",
-            )
+        self._details_panel.renderable = Text.assemble(*parts)
+        self.console.print(self._progress_layout)
 
-        if agent_state.get("errors"):
-            details_text.append(
-                f"❌ Errors: {len(agent_state['errors'])}\n", style="red"
-            )
+    def _build_progress_layout(self):
+        """Build the progress layout and its static text once."""
+        from rich.layout import Layout
+        from rich.panel import Panel
+        from rich.text import Text
+
+        self._status_text = Text("", style="bold green")
+        self._details_panel = Panel(
+            Text(), title="Progress Details", border_style="blue"
+        )
+        self._jobs_found_prefix = Text("📍 Jobs Found: ", style="blue")
+        self._filtered_prefix = Text("✅ Jobs Filtered: ", style="green")
+        self._applied_prefix = Text("🎯 Applications Submitted: ", style="yellow")
+        self._errors_prefix = Text("❌ Errors: ", style="red")
 
-        details_panel = Panel(
-            details_text, title="Progress Details", border_style="blue"
+        layout = Layout()
+        layout.split_column(
+            Layout(name="status", size=3),
+            Layout(name="details"),
         )
-        layout["details"].update(details_panel)
+        layout["status"].update(
+            Panel(self._status_text, title="Current Status", border_style="green")
+        )
+        layout["details"].update(self._details_panel)
+        self._progress_layout = layout
 
-        self.console.print(layout)
+    # CV analysis
 
-    def print_cv_analysis(self, cv_analysis: Dict[str, Any]):
-        """Print CV analysis results."""
-        if self.output_format == "json":
-            print(json.dumps({"cv_analysis": cv_analysis}, indent=2))
-            return
+    def _print_cv_analysis_json(self, cv_analysis: Dict[str, Any]):
+        self._queue_json({"cv_analysis": cv_analysis})
+
+    def _print_cv_analysis_rich(self, cv_analysis: Dict[str, Any]):
+        """Print CV analysis results as a tree."""
+        from rich.tree import Tree
 
         tree = Tree("📄 CV Analysis", style="bold blue")
 
@@ -191,54 +351,56 @@ class TerminalUI:
 
         # Skills
         skills_branch = tree.add("🛠️  Skills", style="cyan")
-        skills = cv_analysis.get("skills", [])
-        for skill in skills[:10]:  # Show first 10 skills
+        skills, extra = _head(cv_analysis.get("skills") or (), 10)
+        for skill in skills:
             skills_branch.add(skill)
-        if len(skills) > 10:
-            skills_branch.add(f"... and {len(skills) - 10} more")
+        if extra:
+            skills_branch.add(f"... and {extra} more")
 
         # Previous roles
         roles_branch = tree.add("👔 Previous Roles", style="yellow")
-        roles = cv_analysis.get("previous_roles", [])
-        for role in roles[:5]:  # Show first 5 roles
+        roles, extra = _head(cv_analysis.get("previous_roles") or (), 5)
+        for role in roles:
             roles_branch.add(role)
-        if len(roles) > 5:
-            roles_branch.add(f"... and {len(roles) - 5} more")
+        if extra:
+            roles_branch.add(f"... and {extra} more")
 
         # Technologies
         tech_branch = tree.add("💻 Technologies", style="magenta")
-        technologies = cv_analysis.get("technologies", [])
-        for tech in technologies[:8]:  # Show first 8 technologies
+        technologies, extra = _head(cv_analysis.get("technologies") or (), 8)
+        for tech in technologies:
             tech_branch.add(tech)
-        if len(technologies) > 8:
-            tech_branch.add(f"... and {len(technologies) - 8} more")
-
-        if self.output_format == "rich":
-            self.console.print(tree)
-        else:
-            self.console.print("CV Analysis:")
-            self.console.print(
-                f"  Experience: {cv_analysis.get('experience_years', 0)} years"
-            )
-            self.console.print(
-                f"  Skills: {', '.join(skills[:5])}{'...' if len(skills) > 5 else ''}"
-            )
-            self.console.print(
-                f"  Previous Roles: {', '.join(roles[:3])}{'...' if len(roles) > 3 else ''}"
-            )
-
-        self.console.print()
-
-    def print_job_results(self, jobs: List[Dict[str, Any]]):
-        """Print job search results."""
-        if self.output_format == "json":
-            print(json.dumps({"jobs_found": jobs}, indent=2))
-            return
-
+        if extra:
+            tech_branch.add(f"... and {extra} more")
+
+        self.write(tree, "")
+        self.flush()
+
+    def _print_cv_analysis_simple(self, cv_analysis: Dict[str, Any]):
+        """Print CV analysis results as plain lines."""
+        skills, more_skills = _head(cv_analysis.get("skills") or (), 5)
+        roles, more_roles = _head(cv_analysis.get("previous_roles") or (), 3)
+        lines = [
+            "CV Analysis:",
+            f"  Experience: {cv_analysis.get('experience_years', 0)} years",
+            f"  Skills: {', '.join(skills)}{'...' if more_skills else ''}",
+            f"  Previous Roles: {', '.join(roles)}{'...' if more_roles else ''}",
+        ]
+        self._write_plain(lines)
+
+    # Job results
+
+    def _print_job_results_json(self, jobs: List[Dict[str, Any]]):
+        self._queue_json({"jobs_found": jobs})
+
+    def _print_job_results_rich(self, jobs: List[Dict[str, Any]]):
+        """Print job search results as a table."""
         if not jobs:
-            self.console.print("❌ No jobs found", style="red")
+            self.console.print(NO_JOBS_FOUND, style="red")
             return
 
+        from rich.table import Table
+
         table = Table(
             title=f"Found {len(jobs)} Jobs",
             show_header=True,
@@ -247,40 +409,47 @@ class TerminalUI:
         table.add_column("Job ID", style="cyan")
         table.add_column("Description Preview", style="green", max_width=60)
 
-        for job in jobs:
-            description_preview = (
-                job.get("job_description", "")[:100] + "..."
-                if len(job.get("job_description", "")) > 100
-                else job.get("job_description", "")
+        rows = [
+            (
+                str(job.get("id_job", "N/A")),
+                _trunc(job.get("job_description") or "", 100),
             )
-            table.add_row(str(job.get("id_job", "N/A")), description_preview)
+            for job in jobs
+        ]
+        _add_rows_bulk(table, rows)
 
-        if self.output_format == "rich":
-            self.console.print(table)
-        else:
-            self.console.print(f"Found {len(jobs)} jobs:")
-            for i, job in enumerate(jobs, 1):
-                description_preview = (
-                    job.get("job_description", "")[:50] + "..."
-                    if len(job.get("job_description", "")) > 50
-                    else job.get("job_description", "")
-                )
-                self.console.print(
-                    f"  {i}. Job {job.get('id_job')}: {description_preview}"
-                )
-
-        self.console.print()
-
-    def print_application_results(self, application_results: List[Dict[str, Any]]):
-        """Print job application results."""
-        if self.output_format == "json":
-            print(json.dumps({"application_results": application_results}, indent=2))
+        self.write(table, "")
+        self.flush()
+
+    def _print_job_results_simple(self, jobs: List[Dict[str, Any]]):
+        """Print job search results as plain lines."""
+        if not jobs:
+            self.console.print(NO_JOBS_FOUND, style="red")
             return
 
+        lines = [f"Found {len(jobs)} jobs:"]
+        for i, job in enumerate(jobs, 1):
+            description = _trunc(job.get("job_description") or "", 50)
+            lines.append(f"  {i}. Job {job.get('id_job')}: {description}")
+        self._write_plain(lines)
+
+    # Application results
+
+    def _print_application_results_json(
+        self, application_results: List[Dict[str, Any]]
+    ):
+        self._queue_json({"application_results": application_results})
+
+    def _print_application_results_rich(
+        self, application_results: List[Dict[str, Any]]
+    ):
+        """Print job application results as a table."""
         if not application_results:
-            self.console.print("❌ No applications submitted", style="red")
+            self.console.print(NO_APPLICATIONS, style="red")
             return
 
+        from rich.table import Table
+
         table = Table(
             title="Application Results", show_header=True, header_style="bold magenta"
         )
@@ -288,117 +457,119 @@ class TerminalUI:
         table.add_column("Status", style="green")
         table.add_column("Error", style="red")
 
-        successful = 0
-        for result in application_results:
-            status = "✅ SUCCESS" if result.get("success") else "❌ FAILED"
-            error = result.get("error", "") if not result.get("success") else ""
-
-            table.add_row(
-                str(result.get("id_job", "N/A")),
-                status,
-                error[:50] + "..." if len(error) > 50 else error,
+        success_flags = [bool(r.get("success")) for r in application_results]
+        rows = [
+            (
+                str(r.get("id_job", "N/A")),
+                APPLICATION_SUCCESS if ok else APPLICATION_FAILED,
+                "" if ok else _trunc(r.get("error") or "", 50),
             )
+            for r, ok in zip(application_results, success_flags)
+        ]
+        _add_rows_bulk(table, rows)
 
-            if result.get("success"):
-                successful += 1
+        self.write(table, "")
+        self.flush()
 
-        if self.output_format == "rich":
-            self.console.print(table)
-        else:
-            self.console.print(
-                f"Application Results ({successful}/{len(application_results)} successful):"
-            )
-            for result in application_results:
-                status = "SUCCESS" if result.get("success") else "FAILED"
-                self.console.print(f"  Job {result.get('id_job')}: {status}")
-                if not result.get("success") and result.get("error"):
-                    self.console.print(f"    Error: {result['error'][:100]}")
-
-        self.console.print()
-
-    def print_final_summary(self, final_state: Dict[str, Any]):
-        """Print final workflow summary."""
-        if self.output_format == "json":
-            # Clean up the state for JSON output
-            clean_state = {
-                k: v for k, v in final_state.items() if k not in ["cv_content"]
-            }
-            print(json.dumps(clean_state, indent=2, default=str))
+    def _print_application_results_simple(
+        self, application_results: List[Dict[str, Any]]
+    ):
+        """Print job application results as plain lines."""
+        if not application_results:
+            self.console.print(NO_APPLICATIONS, style="red")
             return
 
-        # Calculate execution time
-        elapsed_time = ""
-        if self.start_time:
-            elapsed = time.time() - self.start_time
-            elapsed_time = f" (Completed in {elapsed:.1f}s)"
-
-        panel_title = f"🎉 Workflow Complete{elapsed_time}"
-
-        summary_text = Text()
-        summary_text.append("📊 Summary:\n", style="bold blue")
-        summary_text.append(
-            f"  • Jobs Found: {final_state.get('total_jobs_found', 0)}\n", style="green"
-        )
-        summary_text.append(
-            f"  • Jobs Filtered: {len(final_state.get('filtered_jobs', []))}\n",
-            style="yellow",
-        )
-        summary_text.append(
-            f"  • Applications Submitted: {final_state.get('total_jobs_applied', 0)}\n",
-            style="cyan",
+        success_flags = [bool(r.get("success")) for r in application_results]
+        successful = sum(success_flags)
+        lines = [
+            f"Application Results ({successful}/{len(application_results)} successful):"
+        ]
+        for result, ok in zip(application_results, success_flags):
+            lines.append(
+                f"  Job {result.get('id_job')}: {'SUCCESS' if ok else 'FAILED'}"
+            )
+            error = result.get("error")
+            if not ok and error:
+                lines.append(f"    Error: {error[:100]}")
+        self._write_plain(lines)
+
+    # Final summary
+
+    def _print_final_summary_json(self, final_state: Dict[str, Any]):
+        # Clean up the state for JSON output
+        clean_state = {
+            k: v for k, v in final_state.items() if k not in _JSON_EXCLUDED_KEYS
+        }
+        self._queue_json(clean_state)
+
+    def _print_final_summary_rich(self, final_state: Dict[str, Any]):
+        """Print final workflow summary in a panel."""
+        from rich.panel import Panel
+        from rich.text import Text
+
+        panel_title = f"🎉 Workflow Complete{self._elapsed_suffix()}"
+
+        get = final_state.get
+        errors = get("errors")
+        summary_text = Text.assemble(
+            ("📊 Summary:\n", "bold blue"),
+            (f"  • Jobs Found: {get('total_jobs_found', 0)}\n", "green"),
+            (f"  • Jobs Filtered: {len(get('filtered_jobs', []))}\n", "yellow"),
+            (f"  • Applications Submitted: {get('total_jobs_applied', 0)}\n", "cyan"),
+            (f"  • Errors: {len(errors)}\n", "red") if errors else "",
+            (f"\n✅ Status: {get('current_status', 'Complete')}", "bold green"),
         )
 
+        self.write(Panel(summary_text, title=panel_title, border_style="green"))
+        self.flush()
+
+    def _print_final_summary_simple(self, final_state: Dict[str, Any]):
+        """Print final workflow summary as plain lines."""
+        lines = [
+            f"Workflow Complete{self._elapsed_suffix()}",
+            f"Jobs Found: {final_state.get('total_jobs_found', 0)}",
+            f"Jobs Filtered: {len(final_state.get('filtered_jobs', []))}",
+            f"Applications Submitted: {final_state.get('total_jobs_applied', 0)}",
+        ]
         if final_state.get("errors"):
-            summary_text.append(
-                f"  • Errors: {len(final_state['errors'])}\n", style="red"
-            )
-
-        summary_text.append(
-            f"\n✅ Status: {final_state.get('current_status', 'Complete')}",
-            style="bold green",
-        )
+            lines.append(f"Errors: {len(final_state['errors'])}")
+        self._write_plain(lines, blank_line=False)
 
-        panel = Panel(summary_text, title=panel_title, border_style="green")
+    # Errors
 
-        if self.output_format == "rich":
-            self.console.print(panel)
-        else:
-            self.console.print(f"Workflow Complete{elapsed_time}")
-            self.console.print(f"Jobs Found: {final_state.get('total_jobs_found', 0)}")
-            self.console.print(
-                f"Jobs Filtered: {len(final_state.get('filtered_jobs', []))}"
-            )
-            self.console.print(
-                f"Applications Submitted: {final_state.get('total_jobs_applied', 0)}"
-            )
-            if final_state.get("errors"):
-                self.console.print(f"Errors: {len(final_state['errors'])}")
+    def _print_errors_json(self, errors: List[str]):
+        if errors:
+            self._queue_json({"errors": errors})
 
-    def print_errors(self, errors: List[str]):
+    def _print_errors_rich(self, errors: List[str]):
         """Print errors encountered during execution."""
         if not errors:
             return
 
-        if self.output_format == "json":
-            print(json.dumps({"errors": errors}, indent=2))
+        from rich.text import Text
+
+        self.write(Text(ERRORS_HEADER, style="bold red"))
+        self.write(
+            *(Text(f"  {i}. {error}", style="red") for i, error in enumerate(errors, 1))
+        )
+        self.flush()
+
+    def _print_errors_simple(self, errors: List[str]):
+        """Print errors encountered during execution as plain lines."""
+        if not errors:
             return
 
-        self.console.print("\n❌ Errors encountered:", style="bold red")
-        for i, error in enumerate(errors, 1):
-            if self.output_format == "rich":
-                self.console.print(f"  {i}. {error}", style="red")
-            else:
-                self.console.print(f"  {i}. {error}")
+        lines = [ERRORS_HEADER]
+        lines.extend(f"  {i}. {error}" for i, error in enumerate(errors, 1))
+        self._write_plain(lines, blank_line=False)
 
     def start_timer(self):
         """Start timing the workflow."""
-        self.start_time = time.time()
+        self.start_time = perf_counter_ns()
 
     def prompt_user_input(self, message: str, default: Optional[str] = None) -> str:
         """Prompt user for input."""
-        if default:
-            prompt = f"{message} [{default}]: "
-        else:
-            prompt = f"{message}: "
-
-        return self.console.input(prompt) or default
+        prompt = _build_prompt(message, default)
+        if self.output_format == "rich":
+            return self.console.input(prompt) or default
+        return input(prompt) or default
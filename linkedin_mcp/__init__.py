@@ -1,6 +1,10 @@
 # LinkedIn MCP Package - Main exports
 # Only import essential public APIs, avoid circular imports
 
+import importlib
+
+from linkedin_mcp.linkedin import _LAZY as _LINKEDIN_LAZY
+
 # Import types for external API
 from linkedin_mcp.linkedin.model.types import (
     ApplicationRequest,
@@ -17,5 +21,20 @@ __all__ = [
     "JobResult",
 ]
 
-# Services and other components should be imported directly by modules that need them
-# to avoid circular import issues at package initialization time
+# Services, agents and graphs load Selenium/LangGraph, so they are only imported
+# when first accessed as attributes of this package (PEP 562), through the
+# linkedin_mcp.linkedin subpackage that exposes them. Modules inside the
+# package should still import them directly to avoid circular imports.
+_LAZY = dict.fromkeys(_LINKEDIN_LAZY, "linkedin_mcp.linkedin")
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
@@ -1,6 +1,8 @@
 # LinkedIn MCP subpackage
 # Minimal imports to avoid circular dependencies
 
+import importlib
+
 from linkedin_mcp.linkedin.model.types import (
     ApplicationRequest,
     ApplicationResult,
@@ -17,4 +19,29 @@ __all__ = [
     "JobResult",
 ]
 
-# Note: Services, agents, and graphs should be imported directly by modules that need them
+# Services, agents, and graphs pull in Selenium/LangGraph/LLM providers, so they
+# are resolved on first attribute access (PEP 562) instead of at import time.
+# Modules inside the package should keep importing them directly.
+_LAZY = {
+    "EasyApplyAgent": "linkedin_mcp.linkedin.agents.easy_apply_agent",
+    "JobApplicationGraph": "linkedin_mcp.linkedin.graphs.job_application_graph",
+    "JobSearchGraph": "linkedin_mcp.linkedin.graphs.job_search_graph",
+    "LinkedInAuthGraph": "linkedin_mcp.linkedin.graphs.linkedin_auth_graph",
+    "BrowserManagerService": "linkedin_mcp.linkedin.services.browser_manager_service",
+    "JobApplicationService": "linkedin_mcp.linkedin.services.job_application_service",
+    "JobSearchService": "linkedin_mcp.linkedin.services.job_search_service",
+    "LinkedInAuthService": "linkedin_mcp.linkedin.services.linkedin_auth_service",
+    "get_llm_client": "linkedin_mcp.linkedin.providers.llm_client",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
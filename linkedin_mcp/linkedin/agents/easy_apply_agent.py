@@ -1,10 +1,11 @@
+import os
+import re
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, TypedDict
 
 from langchain_core.prompts import ChatPromptTemplate
-from langgraph.graph import END, StateGraph
 from loguru import logger
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -12,14 +13,157 @@ from selenium.webdriver.support.ui import WebDriverWait
 from linkedin_mcp.linkedin.interfaces.agents import IJobApplicationAgent
 from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 from linkedin_mcp.linkedin.model.types import ApplicationRequest, CVAnalysis
-from linkedin_mcp.linkedin.observability.langfuse_config import (
-    get_langfuse_config_for_mcp_langgraph,
-    trace_mcp_operation,
-)
+from linkedin_mcp.linkedin.observability.langfuse_config import trace_mcp_operation
 from linkedin_mcp.linkedin.providers.llm_client import get_llm_client
 
+# All Easy Apply form fields the agent knows how to fill
+FORM_FIELD_SELECTOR = "input[type='text'], textarea, select, input[type='radio']"
+FORM_MODAL_SELECTOR = ".jobs-easy-apply-modal, .artdeco-modal"
+
+# CV list fields whose entries can directly answer a select/radio question when
+# exactly one of the options names one of them
+PROFILE_OPTION_FIELDS = ("education", "certifications", "technologies", "skills")
+
+# Every known Easy Apply button variant, fused into one XPath union so the DOM is
+# searched once instead of once per selector
+EASY_APPLY_BUTTON_XPATH = (
+    "//button[contains(@aria-label, 'Easy Apply')"
+    " or @data-control-name='jobdetails_topcard_inapply'"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' jobs-apply-button ')"
+    " or contains(., 'Easy Apply')]"
+    " | //*[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' jobs-apply-button--top-card ')]//button"
+)
 
-class EasyApplyState(Dict):
+# Submit button variants. The generic primary button is only tried when none of
+# these match, since it also matches the "Next" and "Review" buttons.
+SUBMIT_BUTTON_XPATH = (
+    "//button[contains(@aria-label, 'Submit application')"
+    " or @data-control-name='continue_unify'"
+    " or contains(text(), 'Submit')"
+    " or contains(text(), 'Send application')]"
+)
+PRIMARY_BUTTON_SELECTOR = "button.artdeco-button--primary"
+
+# Words that can stand before "experience" in a question about total work
+# experience ("years of professional experience"). Any other word there, or
+# "experience with/in ...", names a specific technology or field.
+GENERAL_EXPERIENCE_WORDS = {
+    "of",
+    "years",
+    "year",
+    "work",
+    "working",
+    "professional",
+    "relevant",
+    "total",
+    "overall",
+    "industry",
+    "prior",
+    "previous",
+    "your",
+}
+EXPERIENCE_WORD_RE = re.compile(r"([\w+#.-]+)\s+experience\b", re.I)
+EXPERIENCE_SUBJECT_RE = re.compile(
+    r"experience\b.*?\b(?:with|in|using|on|as|doing)\b", re.I
+)
+
+# Buttons that move a multi-step Easy Apply form to its next page
+NEXT_BUTTON_XPATH = (
+    "//button[contains(@aria-label, 'Continue to next step')"
+    " or contains(@aria-label, 'Review your application')"
+    " or @data-easy-apply-next-button]"
+)
+# Upper bound on form pages, in case a step never advances (e.g. a field that
+# fails validation keeps the form on the same page)
+MAX_FORM_STEPS = 10
+
+# Collects every form field on the visible step of the Easy Apply modal with the
+# attributes the agent needs in a single WebDriver round-trip. Fields in hidden
+# panels have no client rects and are skipped. Labels are resolved in the
+# browser as well: label[for=id], then a label next to the field, then the
+# placeholder or aria-label; radio options use label[for=id], the parent's text
+# or the value. The element itself is returned as a WebElement reference.
+FORM_FIELDS_SCRIPT = """
+const forLabel = (el) =>
+    el.id ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`) : null;
+const fieldLabel = (el) => {
+    const label = forLabel(el) || el.parentElement?.querySelector("label");
+    if (label) return label.innerText.trim();
+    return (el.getAttribute("placeholder") || el.getAttribute("aria-label") || "")
+        .trim();
+};
+const radioLabel = (el) => {
+    const label = forLabel(el);
+    if (label) return label.innerText.trim();
+    const value = el.getAttribute("value") || "";
+    const text = el.parentElement?.innerText.trim();
+    return text && text !== value ? text : value;
+};
+const root = document.querySelector(arguments[1]) || document;
+const fields = Array.from(root.querySelectorAll(arguments[0])).filter(
+    (el) => el.getClientRects().length > 0
+);
+return fields.map((el) => ({
+    element: el,
+    tag: el.tagName.toLowerCase(),
+    type: el.getAttribute("type"),
+    name: el.getAttribute("name"),
+    label: fieldLabel(el),
+    option_label: el.type === "radio" ? radioLabel(el) : null,
+    options: el.tagName === "SELECT"
+        ? Array.from(el.options, (o) => o.text).filter((t) => t.trim())
+        : null,
+}));
+"""
+
+
+# Wraps fetch and XMLHttpRequest (once per page) so a successful response from
+# LinkedIn's apply API sets window.__easyApplyDone, and clears the flag for the
+# submission about to be made
+SUBMIT_HOOK_SCRIPT = """
+const isApplyResponse = (url, status) =>
+    status >= 200 && status < 300 && /\\/voyager\\/api\\/.*apply/i.test(url);
+if (!window.__easyApplyHooked) {
+    window.__easyApplyHooked = true;
+    const fetch = window.fetch;
+    window.fetch = async (...args) => {
+        const response = await fetch(...args);
+        if (isApplyResponse(response.url, response.status)) {
+            window.__easyApplyDone = true;
+        }
+        return response;
+    };
+    const open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+        this.addEventListener("load", () => {
+            if (isApplyResponse(String(url), this.status)) {
+                window.__easyApplyDone = true;
+            }
+        });
+        return open.call(this, method, url, ...rest);
+    };
+}
+window.__easyApplyDone = false;
+"""
+
+# Whether the submission went through: the apply API answered, or one of the
+# confirmation messages is shown. Checked in a single call per poll.
+SUBMIT_DONE_SCRIPT = """
+return Boolean(
+    window.__easyApplyDone
+    || document.querySelector(
+        ".artdeco-inline-feedback--success, .jobs-easy-apply-confirmation"
+    )
+    || document.evaluate(
+        "//*[contains(text(), 'Application sent')]",
+        document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue
+);
+"""
+
+
+class EasyApplyState(TypedDict, total=False):
     """State for the EasyApply agent workflow."""
 
     job_id: int
@@ -29,6 +173,7 @@ class EasyApplyState(Dict):
     current_step: str
     form_questions: List[Dict[str, Any]]
     form_answers: Dict[str, Any]
+    form_step: int  # Number of "Next" pages advanced through
     success: bool
     error: str
     trace_id: str  # UUID for tracing this application attempt
@@ -40,8 +185,46 @@ class EasyApplyAgent(IJobApplicationAgent):
     Analyzes form questions and provides intelligent answers based on CV data.
     """
 
-    def __init__(self):
-        self.graph = self._build_graph()
+    def __init__(self, work_authorized: Optional[bool] = None):
+        # Easy Apply availability by job ID, so a job page is only loaded once
+        # to check it
+        self._availability_cache: Dict[str, bool] = {}
+        # Whether the user is authorized to work in the job's country. Only
+        # answered for the user when configured; otherwise the question is
+        # left to the model like any other.
+        if work_authorized is None:
+            configured = os.getenv("LINKEDIN_MCP_WORK_AUTHORIZED", "").lower()
+            if configured in ("true", "false"):
+                work_authorized = configured == "true"
+        self.work_authorized = work_authorized
+        # Questions that can be answered straight from the profile, checked in
+        # order before falling back to the LLM. Entries are (pattern, field
+        # types the shortcut applies to or None for any, answer).
+        self._question_patterns = [
+            (
+                re.compile(r"salary|compensation|expected pay", re.I),
+                ("text",),
+                lambda state, cv, question: str(state["monthly_salary"]),
+            ),
+            (
+                re.compile(r"years? of experience|experience years?", re.I),
+                ("text",),
+                lambda state, cv, question: (
+                    None
+                    if self._names_experience_subject(question)
+                    else str(cv["experience_years"])
+                ),
+            ),
+            (
+                re.compile(r"authorized to work|work authorization", re.I),
+                None,
+                lambda state, cv, question: (
+                    None
+                    if self.work_authorized is None
+                    else "Yes" if self.work_authorized else "No"
+                ),
+            ),
+        ]
         # Initialize LLM model for form analysis
         self.model = get_llm_client()
         self.form_prompt = ChatPromptTemplate.from_template(
@@ -76,27 +259,34 @@ class EasyApplyAgent(IJobApplicationAgent):
         Question: {question}
         """
         )
+        self.chain = self.form_prompt | self.model
 
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow for Easy Apply form handling."""
-        workflow = StateGraph(EasyApplyState)
+    def _run_steps(self, state: EasyApplyState) -> EasyApplyState:
+        """
+        Run the Easy Apply steps in order, stopping at the first failed one.
+
+        The workflow is linear apart from the multi-step form loop, so the
+        steps are called directly and their updates merged into state in place.
+        """
 
-        # Add nodes
-        workflow.add_node("navigate_to_job", self.navigate_to_job_node)
-        workflow.add_node("click_easy_apply", self.click_easy_apply_node)
-        workflow.add_node("analyze_form", self.analyze_form_node)
-        workflow.add_node("fill_form", self.fill_form_node)
-        workflow.add_node("submit_application", self.submit_application_node)
+        def run(step) -> bool:
+            update = step(state)
+            state.update(update)
+            return update.get("success") is not False
 
-        # Define workflow flow
-        workflow.set_entry_point("navigate_to_job")
-        workflow.add_edge("navigate_to_job", "click_easy_apply")
-        workflow.add_edge("click_easy_apply", "analyze_form")
-        workflow.add_edge("analyze_form", "fill_form")
-        workflow.add_edge("fill_form", "submit_application")
-        workflow.add_edge("submit_application", END)
+        if not (run(self.navigate_to_job_node) and run(self.click_easy_apply_node)):
+            return state
 
-        return workflow.compile()
+        while True:
+            if not (run(self.analyze_form_node) and run(self.fill_form_node)):
+                return state
+            if not self._has_next_step(state):
+                break
+            if not run(self.next_step_node):
+                return state
+
+        run(self.submit_application_node)
+        return state
 
     def navigate_to_job_node(self, state: EasyApplyState) -> Dict[str, Any]:
         """Navigate to the specific job posting."""
@@ -109,16 +299,12 @@ class EasyApplyAgent(IJobApplicationAgent):
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
 
-            state["browser_manager"].random_delay(2, 4)
-
             return {
-                **state,
                 "current_step": "navigated_to_job",
             }
 
         except Exception as e:
             return {
-                **state,
                 "success": False,
                 "error": f"Failed to navigate to job: {str(e)}",
                 "current_step": "navigation_failed",
@@ -129,51 +315,25 @@ class EasyApplyAgent(IJobApplicationAgent):
         try:
             driver = state["browser_manager"].driver
 
-            # Multiple selectors for Easy Apply button
-            easy_apply_selectors = [
-                "button[aria-label*='Easy Apply']",
-                "button[data-control-name='jobdetails_topcard_inapply']",
-                ".jobs-apply-button--top-card button",
-                "button.jobs-apply-button",
-                "button:contains('Easy Apply')",
-            ]
-
-            easy_apply_button = None
-            for selector in easy_apply_selectors:
-                try:
-                    if ":contains" in selector:
-                        # Use XPath for text content search
-                        easy_apply_button = driver.find_element(
-                            By.XPATH, f"//button[contains(text(), 'Easy Apply')]"
-                        )
-                    else:
-                        easy_apply_button = driver.find_element(
-                            By.CSS_SELECTOR, selector
-                        )
-                    break
-                except NoSuchElementException:
-                    continue
+            # All Easy Apply button variants in a single lookup
+            buttons = driver.find_elements(By.XPATH, EASY_APPLY_BUTTON_XPATH)
 
-            if not easy_apply_button:
+            if not buttons:
                 return {
-                    **state,
                     "success": False,
                     "error": "Easy Apply button not found",
                     "current_step": "easy_apply_not_found",
                 }
 
             # Click the Easy Apply button
-            easy_apply_button.click()
-            state["browser_manager"].random_delay(3, 5)
+            buttons[0].click()
 
             return {
-                **state,
                 "current_step": "easy_apply_clicked",
             }
 
         except Exception as e:
             return {
-                **state,
                 "success": False,
                 "error": f"Failed to click Easy Apply: {str(e)}",
                 "current_step": "easy_apply_click_failed",
@@ -186,24 +346,34 @@ class EasyApplyAgent(IJobApplicationAgent):
 
             # Wait for form modal to appear
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".jobs-easy-apply-modal, .artdeco-modal")
-                )
+                EC.presence_of_element_located((By.CSS_SELECTOR, FORM_MODAL_SELECTOR))
             )
 
             form_questions = []
 
-            # Look for different types of form fields
-            # Text inputs
-            text_inputs = driver.find_elements(
-                By.CSS_SELECTOR, "input[type='text'], textarea"
+            # Fetch every field of the current step and its attributes in one
+            # script call and classify them locally
+            text_inputs, selects, radios = [], [], []
+            fields = driver.execute_script(
+                FORM_FIELDS_SCRIPT, FORM_FIELD_SELECTOR, FORM_MODAL_SELECTOR
             )
+            for field in fields:
+                if field["tag"] == "select":
+                    selects.append(field)
+                elif field["tag"] == "textarea":
+                    text_inputs.append(field)
+                elif field["type"] == "radio":
+                    radios.append(field)
+                else:
+                    text_inputs.append(field)
+
+            # Text inputs
             for input_field in text_inputs:
-                label = self._get_field_label(driver, input_field)
+                label = input_field["label"]
                 if label:
                     form_questions.append(
                         {
-                            "element": input_field,
+                            "element": input_field["element"],
                             "type": "text",
                             "question": label,
                             "options": None,
@@ -211,57 +381,49 @@ class EasyApplyAgent(IJobApplicationAgent):
                     )
 
             # Select dropdowns
-            selects = driver.find_elements(By.CSS_SELECTOR, "select")
             for select in selects:
-                label = self._get_field_label(driver, select)
-                options = [
-                    option.text
-                    for option in select.find_elements(By.TAG_NAME, "option")
-                    if option.text.strip()
-                ]
+                label = select["label"]
                 if label:
                     form_questions.append(
                         {
-                            "element": select,
+                            "element": select["element"],
                             "type": "select",
                             "question": label,
-                            "options": options,
+                            "options": select["options"],
+                            "options_lower": [o.lower() for o in select["options"]],
                         }
                     )
 
             # Radio buttons
             radio_groups = {}
-            radios = driver.find_elements(By.CSS_SELECTOR, "input[type='radio']")
             for radio in radios:
-                name = radio.get_attribute("name")
+                name = radio["name"]
                 if name not in radio_groups:
-                    label = self._get_field_label(driver, radio)
+                    label = radio["label"]
                     radio_groups[name] = {
                         "elements": [],
                         "type": "radio",
                         "question": label or f"Radio group: {name}",
                         "options": [],
                     }
-                radio_groups[name]["elements"].append(radio)
+                radio_groups[name]["elements"].append(radio["element"])
 
                 # Get radio button label
-                radio_label = self._get_radio_label(driver, radio)
-                if radio_label:
-                    radio_groups[name]["options"].append(radio_label)
+                if radio["option_label"]:
+                    radio_groups[name]["options"].append(radio["option_label"])
 
             # Add radio groups to form questions
             for group_data in radio_groups.values():
+                group_data["options_lower"] = [o.lower() for o in group_data["options"]]
                 form_questions.append(group_data)
 
             return {
-                **state,
                 "form_questions": form_questions,
                 "current_step": "form_analyzed",
             }
 
         except Exception as e:
             return {
-                **state,
                 "success": False,
                 "error": f"Failed to analyze form: {str(e)}",
                 "current_step": "form_analysis_failed",
@@ -271,33 +433,68 @@ class EasyApplyAgent(IJobApplicationAgent):
         """Fill the form using AI-generated answers based on CV analysis."""
         try:
             cv_analysis = state["cv_analysis"]
-            form_answers = {}
+            # Answers accumulate across the pages of a multi-step form
+            form_answers = dict(state.get("form_answers") or {})
+            form_questions = state["form_questions"]
+
+            # Common questions are answered straight from the profile; the rest
+            # go to the model in one batched call instead of a round-trip per field
+            profile_terms = self._profile_terms(cv_analysis)
+            shortcuts = [
+                self._shortcut_answer(question_data, state)
+                or self._profile_option_answer(question_data, profile_terms)
+                for question_data in form_questions
+            ]
+            llm_questions = [
+                question_data
+                for question_data, shortcut in zip(form_questions, shortcuts)
+                if shortcut is None
+            ]
+            # The profile part of the prompt is the same for every question
+            cv_vars = {
+                "skills": ", ".join(cv_analysis["skills"]),
+                "experience_years": cv_analysis["experience_years"],
+                "previous_roles": ", ".join(cv_analysis["previous_roles"]),
+                "education": ", ".join(cv_analysis["education"]),
+                "certifications": ", ".join(cv_analysis["certifications"]),
+                "technologies": ", ".join(cv_analysis["technologies"]),
+                "key_achievements": ", ".join(cv_analysis["key_achievements"]),
+                "monthly_salary": state["monthly_salary"],
+            }
+            llm_inputs = [
+                {
+                    **cv_vars,
+                    "question": question_data["question"],
+                    "question_type": question_data["type"],
+                    "options": (
+                        ", ".join(question_data["options"])
+                        if question_data.get("options")
+                        else "None"
+                    ),
+                }
+                for question_data in llm_questions
+            ]
+            if len(llm_inputs) == 1:
+                # A single answer is streamed so choice questions can stop as
+                # soon as an option has been named
+                llm_responses = [self._stream_answer(llm_inputs[0], llm_questions[0])]
+            else:
+                llm_responses = self.chain.batch(llm_inputs, return_exceptions=True)
+            llm_responses = iter(llm_responses)
+            responses = [
+                shortcut if shortcut is not None else next(llm_responses)
+                for shortcut in shortcuts
+            ]
 
-            for question_data in state["form_questions"]:
+            wait = state["browser_manager"].fast_wait
+            for question_data, response in zip(form_questions, responses):
                 question = question_data["question"]
                 question_type = question_data["type"]
                 options = question_data.get("options", [])
 
                 try:
-                    # Get AI-generated answer
-                    chain = self.form_prompt | self.model
-                    response = chain.invoke(
-                        {
-                            "skills": ", ".join(cv_analysis["skills"]),
-                            "experience_years": cv_analysis["experience_years"],
-                            "previous_roles": ", ".join(cv_analysis["previous_roles"]),
-                            "education": ", ".join(cv_analysis["education"]),
-                            "certifications": ", ".join(cv_analysis["certifications"]),
-                            "technologies": ", ".join(cv_analysis["technologies"]),
-                            "key_achievements": ", ".join(
-                                cv_analysis["key_achievements"]
-                            ),
-                            "monthly_salary": state["monthly_salary"],
-                            "question": question,
-                            "question_type": question_type,
-                            "options": ", ".join(options) if options else "None",
-                        }
-                    )
+                    if isinstance(response, Exception):
+                        raise response
 
                     answer = (
                         response.content.strip()
@@ -305,16 +502,22 @@ class EasyApplyAgent(IJobApplicationAgent):
                         else str(response).strip()
                     )
 
-                    # Fill the form field based on type
+                    # Fill the form field based on type, waiting only as long as
+                    # the field needs to become interactive
                     if question_type == "text":
-                        question_data["element"].clear()
-                        question_data["element"].send_keys(answer)
+                        wait.until(EC.element_to_be_clickable(question_data["element"]))
+                        state["browser_manager"].set_input_value(
+                            question_data["element"], answer
+                        )
 
                     elif question_type == "select":
                         # Find the best matching option
-                        best_option = self._find_best_option_match(answer, options)
+                        best_option = self._find_best_option_match(
+                            answer, options, question_data.get("options_lower")
+                        )
                         if best_option:
                             select_element = question_data["element"]
+                            wait.until(EC.element_to_be_clickable(select_element))
                             for option in select_element.find_elements(
                                 By.TAG_NAME, "option"
                             ):
@@ -324,7 +527,9 @@ class EasyApplyAgent(IJobApplicationAgent):
 
                     elif question_type == "radio":
                         # Find the best matching radio option
-                        best_option = self._find_best_option_match(answer, options)
+                        best_option = self._find_best_option_match(
+                            answer, options, question_data.get("options_lower")
+                        )
                         if best_option:
                             for i, radio_element in enumerate(
                                 question_data["elements"]
@@ -334,85 +539,94 @@ class EasyApplyAgent(IJobApplicationAgent):
                                     break
 
                     form_answers[question] = answer
-                    state["browser_manager"].random_delay(1, 2)
 
                 except Exception as e:
                     print(f"Error filling question '{question}': {str(e)}")
                     form_answers[question] = f"Error: {str(e)}"
 
             return {
-                **state,
                 "form_answers": form_answers,
                 "current_step": "form_filled",
             }
 
         except Exception as e:
             return {
-                **state,
                 "success": False,
                 "error": f"Failed to fill form: {str(e)}",
                 "current_step": "form_fill_failed",
             }
 
+    def _has_next_step(self, state: EasyApplyState) -> bool:
+        """Whether the form has another page to fill before submitting."""
+        if state.get("form_step", 0) >= MAX_FORM_STEPS:
+            return False
+        try:
+            return bool(
+                state["browser_manager"].driver.find_elements(
+                    By.XPATH, NEXT_BUTTON_XPATH
+                )
+            )
+        except Exception:
+            return False
+
+    def next_step_node(self, state: EasyApplyState) -> Dict[str, Any]:
+        """Advance a multi-step Easy Apply form to its next page."""
+        try:
+            driver = state["browser_manager"].driver
+            buttons = driver.find_elements(By.XPATH, NEXT_BUTTON_XPATH)
+            buttons[0].click()
+
+            # The button is re-rendered with the next page; if it is not, the
+            # analysis simply runs against the page as it is
+            try:
+                WebDriverWait(driver, 3, poll_frequency=0.05).until(
+                    EC.staleness_of(buttons[0])
+                )
+            except TimeoutException:
+                pass
+
+            return {
+                "form_step": state.get("form_step", 0) + 1,
+                "current_step": "next_step_clicked",
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to open next form step: {str(e)}",
+                "current_step": "next_step_failed",
+            }
+
     def submit_application_node(self, state: EasyApplyState) -> Dict[str, Any]:
         """Submit the Easy Apply application."""
         try:
             driver = state["browser_manager"].driver
 
-            # Look for submit button
-            submit_selectors = [
-                "button[aria-label*='Submit application']",
-                "button[data-control-name='continue_unify']",
-                "button.artdeco-button--primary",
-                "button:contains('Submit')",
-                "button:contains('Send application')",
-            ]
+            # Look for submit button, falling back to the modal's primary button
+            buttons = driver.find_elements(
+                By.XPATH, SUBMIT_BUTTON_XPATH
+            ) or driver.find_elements(By.CSS_SELECTOR, PRIMARY_BUTTON_SELECTOR)
 
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if ":contains" in selector:
-                        # Use XPath for text content search
-                        submit_button = driver.find_element(
-                            By.XPATH,
-                            f"//button[contains(text(), 'Submit') or contains(text(), 'Send application')]",
-                        )
-                    else:
-                        submit_button = driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-
-            if not submit_button:
+            if not buttons:
                 return {
-                    **state,
                     "success": False,
                     "error": "Submit button not found",
                     "current_step": "submit_button_not_found",
                 }
 
-            # Click submit button
-            submit_button.click()
-            state["browser_manager"].random_delay(3, 5)
+            # Keep a short human-like pause before submitting; the confirmation
+            # wait below covers the time the submission itself takes
+            state["browser_manager"].micro_jitter()
+            driver.execute_script(SUBMIT_HOOK_SCRIPT)
+            buttons[0].click()
 
-            # Wait for confirmation or success message
+            # Wait for the apply API response or a confirmation message
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.any_of(
-                        EC.presence_of_element_located(
-                            (By.CSS_SELECTOR, ".artdeco-inline-feedback--success")
-                        ),
-                        EC.presence_of_element_located(
-                            (By.CSS_SELECTOR, ".jobs-easy-apply-confirmation")
-                        ),
-                        EC.presence_of_element_located(
-                            (By.XPATH, "//*[contains(text(), 'Application sent')]")
-                        ),
-                    )
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(SUBMIT_DONE_SCRIPT)
                 )
 
                 return {
-                    **state,
                     "success": True,
                     "current_step": "application_submitted",
                 }
@@ -420,7 +634,6 @@ class EasyApplyAgent(IJobApplicationAgent):
             except TimeoutException:
                 # Application might still be successful even without confirmation
                 return {
-                    **state,
                     "success": True,
                     "current_step": "application_submitted_no_confirmation",
                     "error": "Application submitted but confirmation not detected",
@@ -428,93 +641,120 @@ class EasyApplyAgent(IJobApplicationAgent):
 
         except Exception as e:
             return {
-                **state,
                 "success": False,
                 "error": f"Failed to submit application: {str(e)}",
                 "current_step": "application_submit_failed",
             }
 
-    def _get_field_label(self, driver, element) -> str:
-        """Extract label text for a form field."""
-        try:
-            # Try to find associated label
-            element_id = element.get_attribute("id")
-            if element_id:
-                try:
-                    label = driver.find_element(
-                        By.CSS_SELECTOR, f"label[for='{element_id}']"
-                    )
-                    return label.text.strip()
-                except NoSuchElementException:
-                    pass
-
-            # Try to find parent label
-            try:
-                parent = element.find_element(By.XPATH, "..")
-                label = parent.find_element(By.TAG_NAME, "label")
-                return label.text.strip()
-            except NoSuchElementException:
-                pass
-
-            # Try placeholder as fallback
-            placeholder = element.get_attribute("placeholder")
-            if placeholder:
-                return placeholder.strip()
-
-            # Try aria-label as fallback
-            aria_label = element.get_attribute("aria-label")
-            if aria_label:
-                return aria_label.strip()
+    def _stream_answer(self, inputs: Dict[str, Any], question_data: Dict[str, Any]):
+        """Stream one answer, stopping early once it is complete.
 
-            return ""
-
-        except Exception:
-            return ""
-
-    def _get_radio_label(self, driver, radio_element) -> str:
-        """Get the label text for a radio button."""
+        Errors are returned rather than raised, matching chain.batch's
+        return_exceptions behaviour.
+        """
         try:
-            # Try to find associated label
-            radio_id = radio_element.get_attribute("id")
-            if radio_id:
-                try:
-                    label = driver.find_element(
-                        By.CSS_SELECTOR, f"label[for='{radio_id}']"
-                    )
-                    return label.text.strip()
-                except NoSuchElementException:
-                    pass
+            buffer = ""
+            for chunk in self.chain.stream(inputs):
+                buffer += getattr(chunk, "content", chunk)
+                if self._answer_complete(buffer, question_data):
+                    break
+            return buffer
+        except Exception as e:
+            return e
 
-            # Try parent element text
-            try:
-                parent = radio_element.find_element(By.XPATH, "..")
-                text = parent.text.strip()
-                if text and text not in ["", radio_element.get_attribute("value")]:
-                    return text
-            except Exception:
-                pass
+    @staticmethod
+    def _answer_complete(buffer: str, question_data: Dict[str, Any]) -> bool:
+        """Whether a partial answer already names one select/radio option."""
+        options_lower = question_data.get("options_lower")
+        if question_data["type"] not in ("select", "radio") or not options_lower:
+            return False
 
-            # Fallback to value attribute
-            return radio_element.get_attribute("value") or ""
+        text = buffer.strip().lower()
+        if not any(text.startswith(option) for option in options_lower):
+            return False
+        # Keep reading while a longer option could still match ("Java" vs "JavaScript")
+        return not any(
+            option != text and option.startswith(text) for option in options_lower
+        )
 
-        except Exception:
-            return ""
+    def _shortcut_answer(
+        self, question_data: Dict[str, Any], state: EasyApplyState
+    ) -> Optional[str]:
+        """Answer a question from the profile without the LLM, if it is a known one."""
+        question = question_data["question"]
+        for pattern, question_types, answer in self._question_patterns:
+            if question_types and question_data["type"] not in question_types:
+                continue
+            if pattern.search(question):
+                return answer(state, state["cv_analysis"], question)
+        return None
+
+    @staticmethod
+    def _names_experience_subject(question: str) -> bool:
+        """Whether an experience question asks about a specific technology or field."""
+        if EXPERIENCE_SUBJECT_RE.search(question):
+            return True
+        return any(
+            word.lower() not in GENERAL_EXPERIENCE_WORDS
+            for word in EXPERIENCE_WORD_RE.findall(question)
+        )
 
-    def _find_best_option_match(self, answer: str, options: List[str]) -> str:
-        """Find the best matching option from available choices."""
+    @staticmethod
+    def _profile_terms(cv_analysis: CVAnalysis) -> set:
+        """Lowercased CV list entries that select/radio options can match."""
+        return {
+            item.strip().lower()
+            for field in PROFILE_OPTION_FIELDS
+            for item in cv_analysis.get(field) or ()
+            if isinstance(item, str)
+        }
+
+    @staticmethod
+    def _profile_option_answer(
+        question_data: Dict[str, Any], profile_terms: set
+    ) -> Optional[str]:
+        """Pick a select/radio option that names exactly one CV entry."""
+        if question_data["type"] not in ("select", "radio"):
+            return None
+
+        options = question_data.get("options") or []
+        options_lower = question_data.get("options_lower") or [
+            option.lower() for option in options
+        ]
+        matches = [
+            option
+            for option, option_lower in zip(options, options_lower)
+            if option_lower.strip() in profile_terms
+        ]
+        # Several matching options is a judgement call; leave it to the model
+        return matches[0] if len(matches) == 1 else None
+
+    def _find_best_option_match(
+        self,
+        answer: str,
+        options: List[str],
+        options_lower: Optional[List[str]] = None,
+    ) -> str:
+        """Find the best matching option from available choices.
+
+        options_lower is the lowercased options list precomputed by
+        analyze_form_node; it is derived here when not given.
+        """
         if not options:
             return ""
 
+        if options_lower is None:
+            options_lower = [option.lower() for option in options]
         answer_lower = answer.lower()
 
         # Direct match
-        for option in options:
-            if answer_lower == option.lower():
+        for option, option_lower in zip(options, options_lower):
+            if answer_lower == option_lower:
                 return option
 
         # Partial match
-        for option in options:
-            if answer_lower in option.lower() or option.lower() in answer_lower:
+        for option, option_lower in zip(options, options_lower):
+            if answer_lower in option_lower or option_lower in answer_lower:
                 return option
 
         # Fallback to first option if no match
@@ -554,21 +794,22 @@ class EasyApplyAgent(IJobApplicationAgent):
             ),
         )
 
-        initial_state = EasyApplyState(
-            job_id=job_id,
-            monthly_salary=application_request.monthly_salary,
-            cv_analysis=cv_analysis,
-            browser_manager=browser_manager,
-            current_step="starting",
-            form_questions=[],
-            form_answers={},
-            success=False,
-            error="",
-            trace_id=trace_id,
-        )
+        initial_state: EasyApplyState = {
+            "job_id": job_id,
+            "monthly_salary": application_request["monthly_salary"],
+            "cv_analysis": cv_analysis,
+            "browser_manager": browser_manager,
+            "current_step": "starting",
+            "form_questions": [],
+            "form_answers": {},
+            "form_step": 0,
+            "success": False,
+            "error": "",
+            "trace_id": trace_id,
+        }
 
         try:
-            final_state = self.graph.invoke(initial_state)
+            final_state = self._run_steps(initial_state)
 
             return {
                 "job_id": job_id,
@@ -591,6 +832,10 @@ class EasyApplyAgent(IJobApplicationAgent):
         self, job_id: str, browser_manager: IBrowserManager
     ) -> bool:
         """Check if Easy Apply is available for the job."""
+        cached = self._availability_cache.get(job_id)
+        if cached is not None:
+            return cached
+
         try:
             driver = browser_manager.get_driver()
             browser_manager.navigate_to_job(job_id)
@@ -599,6 +844,10 @@ class EasyApplyAgent(IJobApplicationAgent):
             easy_apply_button = driver.find_elements(
                 By.XPATH, "//button[contains(@aria-label, 'Easy Apply')]"
             )
-            return len(easy_apply_button) > 0
         except Exception:
+            # Not cached, the failure may be transient
             return False
+
+        available = len(easy_apply_button) > 0
+        self._availability_cache[job_id] = available
+        return available
@@ -1,7 +1,19 @@
+import operator
 import uuid
-from typing import Any, List, Optional, TypedDict
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+)
 
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 from loguru import logger
 
 from linkedin_mcp.linkedin.interfaces.agents import IJobApplicationAgent
@@ -11,16 +23,21 @@ from linkedin_mcp.linkedin.observability.langfuse_config import (
     get_langfuse_config_for_mcp_langgraph,
 )
 
+if TYPE_CHECKING:
+    from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
+
 
 class JobApplicationState(TypedDict):
     applications: List[ApplicationRequest]
     cv_analysis: CVAnalysis
-    browser_manager: IBrowserManager
-    current_application_index: int
-    application_results: List[dict]
+    # Authenticated browsers (a BrowserManagerPool); each application branch
+    # checks one out while it runs
+    browser_pool: Any
+    # Branches return only their own entries; LangGraph appends them via the reducer
+    application_results: Annotated[List[dict], operator.add]
     current_application: Optional[ApplicationRequest]
     job_application_agent: IJobApplicationAgent
-    errors: List[str]
+    errors: Annotated[List[str], operator.add]
     trace_id: str  # UUID for tracing this workflow execution
 
 
@@ -36,29 +53,28 @@ class JobApplicationGraph:
         self.browser_manager = browser_manager
         self.graph = self._create_graph()
 
-    def _create_graph(self) -> StateGraph:
-        """Create the job application workflow graph."""
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _create_graph(cls) -> StateGraph:
+        """
+        Create the job application workflow graph.
+
+        Nodes keep all run data in the state, so the graph is compiled once
+        and shared by every instance.
+        """
         workflow = StateGraph(JobApplicationState)
 
         # Add nodes for job application workflow
-        workflow.add_node("initialize_agent", self._initialize_agent)
-        workflow.add_node("select_next_application", self._select_next_application)
-        workflow.add_node("process_application", self._process_application)
-        workflow.add_node("record_result", self._record_result)
+        workflow.add_node("initialize_agent", cls._initialize_agent)
+        workflow.add_node("process_application", cls._process_application)
 
-        # Define the simplified flow
+        # Fan out one process_application branch per application; branches run
+        # concurrently, bounded by the number of browsers
         workflow.set_entry_point("initialize_agent")
-        workflow.add_edge("initialize_agent", "select_next_application")
-
-        # Conditional edge to check if there are more applications
         workflow.add_conditional_edges(
-            "select_next_application",
-            self._has_more_applications,
-            {"continue": "process_application", "finish": END},
+            "initialize_agent", cls._dispatch_applications, ["process_application"]
         )
-
-        workflow.add_edge("process_application", "record_result")
-        workflow.add_edge("record_result", "select_next_application")
+        workflow.add_edge("process_application", END)
 
         # Compile with Langfuse observability if configured
         langfuse_config = get_langfuse_config_for_mcp_langgraph()
@@ -71,7 +87,8 @@ class JobApplicationGraph:
             logger.debug("JobApplicationGraph compiled without observability")
             return workflow.compile()
 
-    def _initialize_agent(self, state: JobApplicationState) -> JobApplicationState:
+    @staticmethod
+    def _initialize_agent(state: JobApplicationState) -> Dict[str, Any]:
         """Initialize the job application agent."""
         trace_id = state.get("trace_id", str(uuid.uuid4()))
 
@@ -81,47 +98,39 @@ class JobApplicationGraph:
             applications_count=len(state.get("applications", [])),
         )
 
-        return {
-            **state,
-            "trace_id": trace_id,
-            "job_application_agent": self.job_application_agent,
-            "browser_manager": self.browser_manager,
-            "current_application_index": 0,
-        }
-
-    def _select_next_application(
-        self, state: JobApplicationState
-    ) -> JobApplicationState:
-        """Select the next application to process."""
-        trace_id = state.get("trace_id", "unknown")
-        current_index = state["current_application_index"]
-        total_applications = len(state["applications"])
+        return {"trace_id": trace_id}
 
-        if current_index < total_applications:
-            current_application = state["applications"][current_index]
-            logger.info(
-                "Selected next application to process",
-                trace_id=trace_id,
-                current_index=current_index,
-                total_applications=total_applications,
-                job_id=current_application.get("job_id", "unknown"),
-            )
-            return {**state, "current_application": current_application}
-        else:
-            logger.info(
-                "No more applications to process",
-                trace_id=trace_id,
-                processed_count=current_index,
-                total_applications=total_applications,
+    @staticmethod
+    def _dispatch_applications(state: JobApplicationState) -> List[Send]:
+        """Send every application to its own process_application branch."""
+        logger.info(
+            "Dispatching applications",
+            trace_id=state.get("trace_id", "unknown"),
+            applications_count=len(state["applications"]),
+        )
+
+        return [
+            Send(
+                "process_application",
+                {
+                    "current_application": application,
+                    "cv_analysis": state["cv_analysis"],
+                    "browser_pool": state["browser_pool"],
+                    "job_application_agent": state["job_application_agent"],
+                    "trace_id": state["trace_id"],
+                },
             )
-            return state
+            for application in state["applications"]
+        ]
 
-    def _process_application(self, state: JobApplicationState) -> JobApplicationState:
+    @staticmethod
+    def _process_application(state: JobApplicationState) -> Dict[str, Any]:
         """Process a single job application using the EasyApply agent."""
         trace_id = state.get("trace_id", "unknown")
         current_app = state["current_application"]
         job_id = current_app.get("job_id", "unknown")
 
+        browser_manager = state["browser_pool"].acquire()
         try:
             logger.info(
                 "Starting job application processing",
@@ -134,7 +143,7 @@ class JobApplicationGraph:
                 job_id=current_app["job_id"],
                 application_request=current_app,
                 cv_analysis=state["cv_analysis"],
-                browser_manager=state["browser_manager"],
+                browser_manager=browser_manager,
             )
 
             logger.info(
@@ -147,10 +156,7 @@ class JobApplicationGraph:
                 ),
             )
 
-            return {
-                **state,
-                "application_results": state["application_results"] + [result],
-            }
+            return {"application_results": [result]}
 
         except Exception as e:
             logger.error(
@@ -162,66 +168,85 @@ class JobApplicationGraph:
             )
 
             error_result = {
-                "job_id": state["current_application"]["job_id"],
+                "job_id": current_app["job_id"],
                 "success": False,
                 "error": f"Application processing failed: {str(e)}",
             }
 
-            return {
-                **state,
-                "application_results": state["application_results"] + [error_result],
-                "errors": state["errors"] + [str(e)],
-            }
-
-    def _record_result(self, state: JobApplicationState) -> JobApplicationState:
-        """Update the application index to move to next application."""
-        return {
-            **state,
-            "current_application_index": state["current_application_index"] + 1,
-        }
+            return {"application_results": [error_result], "errors": [str(e)]}
 
-    def _has_more_applications(self, state: JobApplicationState) -> str:
-        """Check if there are more applications to process."""
-        if state["current_application_index"] < len(state["applications"]):
-            return "continue"
-        return "finish"
+        finally:
+            state["browser_pool"].release(browser_manager)
 
     def execute(
         self,
         applications: List[ApplicationRequest],
         cv_analysis: CVAnalysis,
-        authenticated_browser_manager: IBrowserManager,
+        authenticated_browser_manager: Optional[IBrowserManager] = None,
         trace_id: str = None,
+        browser_pool: Optional["BrowserManagerPool"] = None,
+        on_result: Optional[Callable[[dict], None]] = None,
     ) -> List[dict]:
-        """Execute the job application workflow with pre-authenticated browser."""
+        """
+        Execute the job application workflow with pre-authenticated browsers.
+
+        Applications are processed concurrently, one per browser in
+        `browser_pool`. Without a pool they run one at a time on
+        `authenticated_browser_manager`.
+
+        `on_result` is called with each application's result as soon as it
+        finishes; the returned list keeps the order of `applications`.
+        """
         # Generate trace_id if not provided
         if not trace_id:
             trace_id = str(uuid.uuid4())
 
+        if browser_pool is None:
+            from linkedin_mcp.linkedin.services.browser_pool import (
+                BrowserManagerPool,
+            )
+
+            browser_pool = BrowserManagerPool(
+                [authenticated_browser_manager or self.browser_manager]
+            )
+
         logger.info(
             "Executing job application graph",
             trace_id=trace_id,
             applications_count=len(applications),
+            browser_count=len(browser_pool),
         )
 
         initial_state = JobApplicationState(
             applications=applications,
             cv_analysis=cv_analysis,
-            browser_manager=authenticated_browser_manager,
-            current_application_index=0,
+            browser_pool=browser_pool,
             application_results=[],
             current_application=None,
-            job_application_agent=None,
+            job_application_agent=self.job_application_agent,
             errors=[],
             trace_id=trace_id,  # Propagate trace_id through the workflow
         )
 
-        result = self.graph.invoke(initial_state)
+        # Each branch holds a browser for its whole run, so running more
+        # branches than browsers at once would only queue them up
+        result = initial_state
+        for mode, chunk in self.graph.stream(
+            initial_state,
+            config={"max_concurrency": len(browser_pool)},
+            stream_mode=["updates", "values"],
+        ):
+            if mode == "values":
+                result = chunk
+            elif on_result:
+                update = chunk.get("process_application") or {}
+                for application_result in update.get("application_results", []):
+                    on_result(application_result)
 
         logger.info(
             "Job application graph execution completed",
             trace_id=trace_id,
-            results_count=len(result.get("application_results", [])),
+            results_count=len(result["application_results"]),
             errors_count=len(result.get("errors", [])),
         )
 
@@ -1,8 +1,10 @@
+import re
 import time
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote, urlencode
 
 from langgraph.graph import END, StateGraph
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,6 +13,77 @@ from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 from linkedin_mcp.linkedin.model.job_search_state import JobSearchState
 from linkedin_mcp.linkedin.model.types import JobResult
 
+_SEARCH_BASE_URL = "https://www.linkedin.com/jobs/search/"
+# Endpoint the results list loads more cards from; it returns the card markup
+# alone, without the page around it
+_JOBS_API_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+# LinkedIn serves at most 1000 results per search
+_JOBS_API_MAX_OFFSET = 1000
+# Endpoint serving a single job posting, including its full description
+_JOB_POSTING_API_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/"
+# Description requests in flight at once
+_DESCRIPTION_FETCH_CONCURRENCY = 8
+_NO_DESCRIPTION = "No description available"
+# Only matches an enabled next button, so a single lookup answers both
+# "is there a next page" and "can it be clicked"
+_NEXT_BTN_SEL = (
+    "button[aria-label='View next page']:not([disabled]), "
+    ".artdeco-pagination__button--next:not([disabled])"
+)
+_JOB_CARD_SEL = ".job-search-card"
+# Poll interval for the wait on the previous results going stale; they are
+# usually replaced within a few tens of milliseconds, well inside
+# WebDriverWait's 500ms default
+_POLL_FREQUENCY = 0.05
+_JOB_ID_RE = re.compile(r"/view/(\d+)")
+
+# Link and snippet of every job card under a root node
+_READ_JOB_CARDS_JS = """
+const readJobCards = (root) =>
+    Array.from(root.querySelectorAll(".job-search-card"), (card) => ({
+        href: card.querySelector("h3 a")?.href || "",
+        description: card.querySelector(".job-search-card__snippet")?.textContent.trim(),
+    }));
+"""
+
+# Job cards of the current page, read in a single WebDriver round-trip instead
+# of several calls per card
+_JOB_CARDS_SCRIPT = _READ_JOB_CARDS_JS + "return readJobCards(document);"
+
+# Fetches the descriptions of several job postings concurrently, with a short
+# random pause before each request; calls back with {job_id: description} for
+# the postings that could be read
+_FETCH_DESCRIPTIONS_SCRIPT = """
+const [baseUrl, jobIds, concurrency, done] = arguments;
+const descriptions = {};
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+let next = 0;
+const worker = async () => {
+    while (next < jobIds.length) {
+        const jobId = jobIds[next++];
+        await sleep(200 + Math.random() * 400);
+        try {
+            const response = await fetch(baseUrl + jobId, { credentials: "include" });
+            if (!response.ok) continue;
+            const doc = new DOMParser().parseFromString(await response.text(), "text/html");
+            const markup = doc.querySelector(".show-more-less-html__markup, .description__text");
+            if (markup) descriptions[jobId] = markup.textContent.trim();
+        } catch (error) {}
+    }
+};
+Promise.all(Array.from({ length: concurrency }, worker)).then(() => done(descriptions));
+"""
+
+# Fetches a page of job cards with the browser's session and parses it without
+# rendering; calls back with null if the request fails
+_FETCH_JOB_CARDS_SCRIPT = _READ_JOB_CARDS_JS + """
+const [url, done] = arguments;
+fetch(url, { credentials: "include" })
+    .then((response) => (response.ok ? response.text() : Promise.reject()))
+    .then((html) => done(readJobCards(new DOMParser().parseFromString(html, "text/html"))))
+    .catch(() => done(null));
+"""
+
 
 class JobSearchGraph:
     """LangGraph workflow for LinkedIn job search RPA."""
@@ -19,27 +92,45 @@ class JobSearchGraph:
         self.browser_manager = browser_manager
         self.graph = self._create_graph()
 
-    def _create_graph(self) -> StateGraph:
-        """Create the job search workflow graph."""
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _create_graph(cls) -> StateGraph:
+        """
+        Create the job search workflow graph.
+
+        Nodes keep all run data in the state, so the graph is compiled once
+        and shared by every instance.
+        """
         workflow = StateGraph(JobSearchState)
 
         # Add nodes for job search workflow
-        workflow.add_node("build_search_url", self._build_search_url)
-        workflow.add_node("navigate_to_search", self._navigate_to_search)
-        workflow.add_node("extract_jobs_from_page", self._extract_jobs_from_page)
-        workflow.add_node("check_pagination", self._check_pagination)
-        workflow.add_node("navigate_next_page", self._navigate_next_page)
+        workflow.add_node("build_search_url", cls._build_search_url)
+        workflow.add_node("fetch_jobs_page", cls._fetch_jobs_page)
+        workflow.add_node("navigate_to_search", cls._navigate_to_search)
+        workflow.add_node("extract_jobs_from_page", cls._extract_jobs_from_page)
+        workflow.add_node("navigate_next_page", cls._navigate_next_page)
 
         # Define the workflow flow
         workflow.set_entry_point("build_search_url")
-        workflow.add_edge("build_search_url", "navigate_to_search")
+        workflow.add_edge("build_search_url", "fetch_jobs_page")
+
+        # Result pages are fetched directly; the browser only renders the
+        # search page if that fails before any job was found
+        workflow.add_conditional_edges(
+            "fetch_jobs_page",
+            cls._should_fetch_next_page,
+            {
+                "fetch": "fetch_jobs_page",
+                "browser": "navigate_to_search",
+                "finish": END,
+            },
+        )
         workflow.add_edge("navigate_to_search", "extract_jobs_from_page")
-        workflow.add_edge("extract_jobs_from_page", "check_pagination")
 
         # Conditional edge to check if we should continue to next page
         workflow.add_conditional_edges(
-            "check_pagination",
-            self._should_continue_pagination,
+            "extract_jobs_from_page",
+            cls._should_continue_pagination,
             {"continue": "navigate_next_page", "finish": END},
         )
 
@@ -47,116 +138,171 @@ class JobSearchGraph:
 
         return workflow.compile()
 
-    def _build_search_url(self, state: JobSearchState) -> Dict[str, Any]:
+    @staticmethod
+    def _build_search_url(state: JobSearchState) -> Dict[str, Any]:
         """Build the LinkedIn job search URL with filters."""
-        base_url = "https://www.linkedin.com/jobs/search/"
-
         # Build search parameters
-        params = []
-
-        if state["job_title"]:
-            params.append(f"keywords={state['job_title'].replace(' ', '%20')}")
-
-        if state["location"]:
-            params.append(f"location={state['location'].replace(' ', '%20')}")
-
+        params = {"keywords": state["job_title"], "location": state["location"]}
         if state["easy_apply"]:
-            params.append("f_LF=f_AL")  # Easy Apply filter
+            params["f_LF"] = "f_AL"  # Easy Apply filter
+        params = {key: value for key, value in params.items() if value}
 
-        # Construct the final URL
-        search_url = base_url
+        # Construct the final URL, percent-encoding the values so titles with
+        # "&", "+" or non-ASCII characters keep their meaning
+        search_url = _SEARCH_BASE_URL
         if params:
-            search_url += "?" + "&".join(params)
+            search_url += "?" + urlencode(params, quote_via=quote)
 
-        return {
-            **state,
-            "search_url": search_url,
-            "current_page": 1,
-        }
+        # The results endpoint takes the Easy Apply filter as f_AL
+        api_params = {key: value for key, value in params.items() if key != "f_LF"}
+        if state["easy_apply"]:
+            api_params["f_AL"] = "true"
+        api_url = _JOBS_API_URL + "?" + urlencode(api_params, quote_via=quote)
 
-    def _navigate_to_search(self, state: JobSearchState) -> Dict[str, Any]:
-        """Navigate to the job search results page."""
-        try:
-            state["browser_manager"].driver.get(state["search_url"])
+        return {"search_url": search_url, "api_url": api_url, "current_page": 1}
 
-            # Wait for results to load
-            WebDriverWait(state["browser_manager"].driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "job-search-card"))
+    @staticmethod
+    def _fetch_jobs_page(state: JobSearchState) -> Dict[str, Any]:
+        """Fetch the next page of job cards without rendering the search page."""
+        try:
+            browser_manager = state["browser_manager"]
+            api_offset = state["api_offset"]
+            # Space out requests after the first, as scrolling the list would
+            if api_offset:
+                browser_manager.micro_jitter()
+
+            job_cards = browser_manager.driver.execute_async_script(
+                _FETCH_JOB_CARDS_SCRIPT, f"{state['api_url']}&start={api_offset}"
             )
+            if not job_cards:
+                return {"api_page_jobs": 0}
 
-            state["browser_manager"].random_delay(2, 4)
+            update = JobSearchGraph._collect_jobs(state, job_cards)
+            JobSearchGraph._fill_descriptions(browser_manager, update["collected_jobs"])
 
             return {
-                **state,
+                **update,
+                "api_offset": api_offset + len(job_cards),
+                "api_page_jobs": len(update["collected_jobs"]),
             }
 
         except Exception as e:
             return {
-                **state,
-                "errors": state["errors"] + [f"Failed to navigate to search: {str(e)}"],
+                "api_page_jobs": 0,
+                "errors": [f"Failed to fetch jobs page: {str(e)}"],
             }
 
-    def _extract_jobs_from_page(self, state: JobSearchState) -> Dict[str, Any]:
+    @staticmethod
+    def _fill_descriptions(
+        browser_manager: IBrowserManager, jobs: List[JobResult]
+    ) -> None:
+        """Fetch the full description of jobs whose card had no snippet."""
+        job_ids = [
+            job["id_job"] for job in jobs if job["job_description"] == _NO_DESCRIPTION
+        ]
+        if not job_ids:
+            return
+
+        try:
+            descriptions = browser_manager.driver.execute_async_script(
+                _FETCH_DESCRIPTIONS_SCRIPT,
+                _JOB_POSTING_API_URL,
+                job_ids,
+                _DESCRIPTION_FETCH_CONCURRENCY,
+            )
+        except Exception:
+            # Jobs keep the placeholder description
+            return
+
+        for job in jobs:
+            description = descriptions.get(str(job["id_job"]))
+            if description:
+                job["job_description"] = description
+
+    @staticmethod
+    def _should_fetch_next_page(state: JobSearchState) -> str:
+        """Decide whether to fetch more results or fall back to the browser."""
+        # A page without new jobs ends the search; if nothing was collected
+        # from the endpoint at all, the rendered search page is read instead
+        if not state["api_page_jobs"]:
+            return "finish" if state["collected_jobs"] else "browser"
+
+        if (
+            len(state["collected_jobs"]) >= state["limit"]
+            or state["api_offset"] >= _JOBS_API_MAX_OFFSET
+        ):
+            return "finish"
+
+        return "fetch"
+
+    @staticmethod
+    def _navigate_to_search(state: JobSearchState) -> Dict[str, Any]:
+        """Navigate to the job search results page."""
+        try:
+            browser_manager = state["browser_manager"]
+            browser_manager.driver.get(state["search_url"])
+
+            # Wait for results to load
+            browser_manager.wait_for_page_idle(10)
+            browser_manager.wait_for_css(_JOB_CARD_SEL)
+
+            browser_manager.micro_jitter()
+
+            return {}
+
+        except Exception as e:
+            return {"errors": [f"Failed to navigate to search: {str(e)}"]}
+
+    @staticmethod
+    def _extract_jobs_from_page(state: JobSearchState) -> Dict[str, Any]:
         """Extract job listings from the current page."""
         try:
             driver = state["browser_manager"].driver
-            job_cards = driver.find_elements(By.CLASS_NAME, "job-search-card")
-
-            page_jobs = []
-
-            for card in job_cards:
-                try:
-                    # Extract job ID from data attributes or href
-                    job_link = card.find_element(By.CSS_SELECTOR, "h3 a")
-                    job_url = job_link.get_attribute("href")
-
-                    # Extract job ID from URL
-                    job_id = None
-                    if "/view/" in job_url:
-                        job_id = int(job_url.split("/view/")[1].split("/")[0])
-
-                    if not job_id:
-                        continue
-
-                    # Extract job description (summary from search results)
-                    try:
-                        description_element = card.find_element(
-                            By.CSS_SELECTOR, ".job-search-card__snippet"
-                        )
-                        job_description = description_element.text.strip()
-                    except NoSuchElementException:
-                        job_description = "No description available"
-
-                    # Only collect jobs if we haven't reached the limit
-                    if len(state["collected_jobs"]) + len(page_jobs) < state["limit"]:
-                        page_jobs.append(
-                            JobResult(
-                                id_job=job_id,
-                                job_description=job_description,
-                            )
-                        )
-
-                except Exception as e:
-                    # Skip problematic job cards
-                    continue
+            job_cards = driver.execute_script(_JOB_CARDS_SCRIPT)
 
-            return {
-                **state,
-                "collected_jobs": state["collected_jobs"] + page_jobs,
-                "total_found": state["total_found"] + len(page_jobs),
-            }
+            return JobSearchGraph._collect_jobs(state, job_cards)
 
         except Exception as e:
-            return {
-                **state,
-                "errors": state["errors"] + [f"Failed to extract jobs: {str(e)}"],
-            }
+            return {"errors": [f"Failed to extract jobs: {str(e)}"]}
+
+    @staticmethod
+    def _collect_jobs(state: JobSearchState, job_cards: List[dict]) -> Dict[str, Any]:
+        """Turn job cards into the state update for the jobs not collected yet."""
+        page_jobs = []
+        page_job_ids = set()
+        # Only collect jobs if we haven't reached the limit
+        remaining = state["limit"] - len(state["collected_jobs"])
+
+        for card in job_cards:
+            if len(page_jobs) >= remaining:
+                break
+
+            # Extract job ID from the card's link, skipping cards without one
+            match = _JOB_ID_RE.search(card["href"])
+            if not match:
+                continue
+
+            # Skip jobs already collected from this or an earlier page
+            job_id = int(match.group(1))
+            if job_id in state["seen_job_ids"] or job_id in page_job_ids:
+                continue
+            page_job_ids.add(job_id)
+
+            page_jobs.append(
+                JobResult(
+                    id_job=job_id,
+                    job_description=card["description"] or _NO_DESCRIPTION,
+                )
+            )
 
-    def _check_pagination(self, state: JobSearchState) -> Dict[str, Any]:
-        """Check if there are more pages and if we should continue."""
-        return state
+        return {
+            "collected_jobs": page_jobs,
+            "seen_job_ids": page_job_ids,
+            "total_found": len(page_jobs),
+        }
 
-    def _should_continue_pagination(self, state: JobSearchState) -> str:
+    @staticmethod
+    def _should_continue_pagination(state: JobSearchState) -> str:
         """Determine if we should continue to the next page."""
         # Stop if we've collected enough jobs
         if len(state["collected_jobs"]) >= state["limit"]:
@@ -166,53 +312,40 @@ class JobSearchGraph:
         if state["current_page"] >= 10:
             return "finish"
 
-        # Check if next page button exists
-        try:
-            driver = state["browser_manager"].driver
-            next_button = driver.find_element(
-                By.CSS_SELECTOR,
-                "button[aria-label='View next page'], .artdeco-pagination__button--next",
-            )
-
-            # Check if the button is enabled
-            if next_button.is_enabled() and not next_button.get_attribute("disabled"):
-                return "continue"
-
-        except NoSuchElementException:
-            pass
+        # Continue only if an enabled next page button exists
+        driver = state["browser_manager"].driver
+        if driver.find_elements(By.CSS_SELECTOR, _NEXT_BTN_SEL):
+            return "continue"
 
         return "finish"
 
-    def _navigate_next_page(self, state: JobSearchState) -> Dict[str, Any]:
+    @staticmethod
+    def _navigate_next_page(state: JobSearchState) -> Dict[str, Any]:
         """Navigate to the next page of search results."""
         try:
             driver = state["browser_manager"].driver
 
             # Find and click the next page button
-            next_button = driver.find_element(
-                By.CSS_SELECTOR,
-                "button[aria-label='View next page'], .artdeco-pagination__button--next",
-            )
+            next_buttons = driver.find_elements(By.CSS_SELECTOR, _NEXT_BTN_SEL)
+            if not next_buttons:
+                return {"errors": ["No enabled next page button found"]}
+            next_button = next_buttons[0]
+            previous_cards = driver.find_elements(By.CSS_SELECTOR, _JOB_CARD_SEL)
 
             next_button.click()
-            state["browser_manager"].random_delay(3, 5)
+            state["browser_manager"].micro_jitter()
 
-            # Wait for new results to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "job-search-card"))
-            )
+            # Wait for the previous page's results to be replaced by new ones
+            if previous_cards:
+                WebDriverWait(driver, 10, poll_frequency=_POLL_FREQUENCY).until(
+                    EC.staleness_of(previous_cards[0])
+                )
+            state["browser_manager"].wait_for_css(_JOB_CARD_SEL)
 
-            return {
-                **state,
-                "current_page": state["current_page"] + 1,
-            }
+            return {"current_page": state["current_page"] + 1}
 
         except Exception as e:
-            return {
-                **state,
-                "errors": state["errors"]
-                + [f"Failed to navigate to next page: {str(e)}"],
-            }
+            return {"errors": [f"Failed to navigate to next page: {str(e)}"]}
 
     def execute(
         self,
@@ -221,8 +354,14 @@ class JobSearchGraph:
         easy_apply: bool,
         limit: int,
         authenticated_browser_manager: IBrowserManager,
+        on_page: Optional[Callable[[List[JobResult]], None]] = None,
     ) -> List[JobResult]:
-        """Execute the job search workflow with pre-authenticated browser."""
+        """
+        Execute the job search workflow with pre-authenticated browser.
+
+        `on_page` is called with the jobs of each results page as soon as the
+        page has been read, before the search moves on.
+        """
         initial_state = JobSearchState(
             job_title=job_title,
             location=location,
@@ -231,10 +370,28 @@ class JobSearchGraph:
             browser_manager=authenticated_browser_manager,
             current_page=1,
             collected_jobs=[],
+            seen_job_ids=set(),
             search_url=None,
+            api_url=None,
+            api_offset=0,
+            api_page_jobs=0,
             total_found=0,
             errors=[],
         )
 
-        result = self.graph.invoke(initial_state)
+        result = initial_state
+        for mode, chunk in self.graph.stream(
+            initial_state, stream_mode=["updates", "values"]
+        ):
+            if mode == "values":
+                result = chunk
+            elif on_page:
+                page = (
+                    chunk.get("fetch_jobs_page")
+                    or chunk.get("extract_jobs_from_page")
+                    or {}
+                )
+                if page.get("collected_jobs"):
+                    on_page(page["collected_jobs"])
+
         return result["collected_jobs"]
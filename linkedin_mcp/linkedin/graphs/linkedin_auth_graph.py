@@ -1,11 +1,18 @@
+from functools import lru_cache
+from typing import Any, Dict
+
 from langgraph.graph import END, StateGraph
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 from linkedin_mcp.linkedin.model.types import AuthState
 
+# Either element only renders for a signed-in member
+_LOGGED_IN_SEL = '[data-test-id="nav-top-profile"], input[aria-label*="Search job"]'
+
 
 class LinkedInAuthGraph:
     """LangGraph workflow for LinkedIn authentication."""
@@ -13,15 +20,22 @@ class LinkedInAuthGraph:
     def __init__(self):
         self.graph = self._create_graph()
 
-    def _create_graph(self) -> StateGraph:
-        """Create the authentication workflow graph."""
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _create_graph(cls) -> StateGraph:
+        """
+        Create the authentication workflow graph.
+
+        Nodes keep all run data in the state, so the graph is compiled once
+        and shared by every instance.
+        """
         workflow = StateGraph(AuthState)
 
         # Add nodes for authentication steps
-        workflow.add_node("navigate_to_login", self._navigate_to_login)
-        workflow.add_node("fill_credentials", self._fill_credentials)
-        workflow.add_node("submit_login", self._submit_login)
-        workflow.add_node("verify_authentication", self._verify_authentication)
+        workflow.add_node("navigate_to_login", cls._navigate_to_login)
+        workflow.add_node("fill_credentials", cls._fill_credentials)
+        workflow.add_node("submit_login", cls._submit_login)
+        workflow.add_node("verify_authentication", cls._verify_authentication)
 
         # Define the flow
         workflow.set_entry_point("navigate_to_login")
@@ -32,44 +46,41 @@ class LinkedInAuthGraph:
 
         return workflow.compile()
 
-    def _navigate_to_login(self, state: AuthState) -> AuthState:
+    @staticmethod
+    def _navigate_to_login(state: AuthState) -> Dict[str, Any]:
         """Navigate to LinkedIn jobs page."""
         try:
             driver = state["browser_manager"].driver
             driver.get("https://www.linkedin.com/jobs/")
-            state["browser_manager"].random_delay(2, 4)
-            return state
+            state["browser_manager"].wait_for_page_idle()
+            state["browser_manager"].micro_jitter()
+            return {}
         except Exception as e:
-            state["error"] = f"Failed to navigate to LinkedIn: {str(e)}"
-            return state
+            return {"error": f"Failed to navigate to LinkedIn: {str(e)}"}
 
-    def _fill_credentials(self, state: AuthState) -> AuthState:
+    @staticmethod
+    def _fill_credentials(state: AuthState) -> Dict[str, Any]:
         """Fill email and password fields."""
         try:
             browser_manager = state["browser_manager"]
 
             # Wait for and fill email field
             email_field = browser_manager.wait_for_element(By.ID, "session_key")
-            email_field.clear()
-            email_field.send_keys(state["email"])
-            browser_manager.random_delay(1, 2)
+            browser_manager.set_input_value(email_field, state["email"])
 
             # Wait for and fill password field
             password_field = browser_manager.wait_for_element(By.ID, "session_password")
-            password_field.clear()
-            password_field.send_keys(state["password"])
-            browser_manager.random_delay(1, 2)
+            browser_manager.set_input_value(password_field, state["password"])
 
-            return state
+            return {}
 
         except TimeoutException:
-            state["error"] = "Login form not found - page structure may have changed"
-            return state
+            return {"error": "Login form not found - page structure may have changed"}
         except Exception as e:
-            state["error"] = f"Failed to fill credentials: {str(e)}"
-            return state
+            return {"error": f"Failed to fill credentials: {str(e)}"}
 
-    def _submit_login(self, state: AuthState) -> AuthState:
+    @staticmethod
+    def _submit_login(state: AuthState) -> Dict[str, Any]:
         """Click the Sign In button."""
         try:
             browser_manager = state["browser_manager"]
@@ -79,18 +90,27 @@ class LinkedInAuthGraph:
                 By.CSS_SELECTOR, 'button[data-id="sign-in-form__submit-btn"]'
             )
             sign_in_btn.click()
-            browser_manager.random_delay(3, 5)
+            browser_manager.micro_jitter()
 
-            return state
+            # Wait for the login form to be replaced by the next page, if any;
+            # verify_authentication decides whether the login worked
+            try:
+                WebDriverWait(browser_manager.driver, 10, poll_frequency=0.05).until(
+                    EC.staleness_of(sign_in_btn)
+                )
+                browser_manager.wait_for_page_idle()
+            except TimeoutException:
+                pass
+
+            return {}
 
         except TimeoutException:
-            state["error"] = "Sign In button not found"
-            return state
+            return {"error": "Sign In button not found"}
         except Exception as e:
-            state["error"] = f"Failed to submit login: {str(e)}"
-            return state
+            return {"error": f"Failed to submit login: {str(e)}"}
 
-    def _verify_authentication(self, state: AuthState) -> AuthState:
+    @staticmethod
+    def _verify_authentication(state: AuthState) -> Dict[str, Any]:
         """Verify that authentication was successful."""
         try:
             driver = state["browser_manager"].driver
@@ -98,33 +118,25 @@ class LinkedInAuthGraph:
 
             # Check if we're redirected away from login page
             if "/jobs/" in current_url and "/login" not in current_url:
-                # Additional check for presence of user-specific elements
-                try:
-                    # Look for elements that indicate successful login
-                    driver.find_element(
-                        By.CSS_SELECTOR, '[data-test-id="nav-top-profile"]'
-                    )
-                    state["authenticated"] = True
-                except NoSuchElementException:
-                    # Alternative check for job search elements
-                    try:
-                        driver.find_element(
-                            By.CSS_SELECTOR, 'input[aria-label*="Search job"]'
-                        )
-                        state["authenticated"] = True
-                    except NoSuchElementException:
-                        state["authenticated"] = False
-                        state["error"] = "Authentication verification failed"
+                # Look for elements that indicate successful login: the
+                # profile menu or the job search box
+                if driver.find_elements(By.CSS_SELECTOR, _LOGGED_IN_SEL):
+                    return {"authenticated": True}
+                return {
+                    "authenticated": False,
+                    "error": "Authentication verification failed",
+                }
             else:
-                state["authenticated"] = False
-                state["error"] = "Login failed - still on login page"
-
-            return state
+                return {
+                    "authenticated": False,
+                    "error": "Login failed - still on login page",
+                }
 
         except Exception as e:
-            state["authenticated"] = False
-            state["error"] = f"Authentication verification error: {str(e)}"
-            return state
+            return {
+                "authenticated": False,
+                "error": f"Authentication verification error: {str(e)}",
+            }
 
     def execute(
         self, email: str, password: str, browser_manager: "IBrowserManager"
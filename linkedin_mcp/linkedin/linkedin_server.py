@@ -3,9 +3,17 @@ LinkedIn MCP Server - Main entry point
 Uses standard TCP implementation for MCP protocol
 """
 
+import atexit
+import hashlib
+import importlib.util
 import os
+import threading
+import time
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from fastmcp import FastMCP
+import anyio
+from fastmcp import Context, FastMCP
 
 from linkedin_mcp.linkedin.model.types import (
     ApplicationRequest,
@@ -13,42 +21,259 @@ from linkedin_mcp.linkedin.model.types import (
     CVAnalysis,
     JobResult,
 )
-from linkedin_mcp.linkedin.services.job_application_service import JobApplicationService
-from linkedin_mcp.linkedin.services.job_search_service import JobSearchService
 from linkedin_mcp.linkedin.utils.logging_config import (
     configure_mcp_logging,
     log_mcp_server_startup,
     log_mcp_tool_registration,
 )
 
-# Configure logging for LinkedIn MCP server
-configure_mcp_logging()
+if TYPE_CHECKING:
+    from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
+    from linkedin_mcp.linkedin.services.job_application_service import (
+        JobApplicationService,
+    )
+    from linkedin_mcp.linkedin.services.job_search_service import JobSearchService
 
 mcp = FastMCP("LinkedIn Job Applier")
 
-# Log server startup
-log_mcp_server_startup(
-    {
-        "name": "LinkedIn Job Applier",
-        "version": "1.16.0",
-        "transport": "stdio",
-        "fastmcp_version": "2.12.4",
-        "mcp_sdk_version": "1.16.0",
-    }
-)
 
-# Initialize services
-job_search_service = JobSearchService()
-job_application_service = JobApplicationService()
+@lru_cache(maxsize=None)
+def _configure_logging() -> None:
+    """Configure logging for LinkedIn MCP server, once per process."""
+    configure_mcp_logging()
+
+    # Log server startup
+    log_mcp_server_startup(
+        {
+            "name": "LinkedIn Job Applier",
+            "version": "1.16.0",
+            "transport": "stdio",
+            "fastmcp_version": "2.12.4",
+            "mcp_sdk_version": "1.16.0",
+        }
+    )
+
+    # Log registered tools
+    log_mcp_tool_registration(
+        [
+            {"name": "search_jobs", "description": "Search LinkedIn jobs with filters"},
+            {
+                "name": "easy_apply_for_jobs",
+                "description": "Apply to jobs using Easy Apply with AI form handling",
+            },
+        ]
+    )
+
+
+# Services pull in Selenium, LangGraph and the LLM client, so they are created
+# on the first tool call rather than when the server process starts
+@lru_cache(maxsize=None)
+def _get_search_service() -> "JobSearchService":
+    from linkedin_mcp.linkedin.services.job_search_service import JobSearchService
+
+    return JobSearchService()
+
+
+@lru_cache(maxsize=None)
+def _get_application_service() -> "JobApplicationService":
+    from linkedin_mcp.linkedin.services.job_application_service import (
+        JobApplicationService,
+    )
+
+    return JobApplicationService()
+
+
+# Authenticated browsers kept between tool calls so back-to-back calls for the
+# same account skip the login flow. Keyed by a hash of the credentials; entries
+# are (pool, email, last_used) and are closed once idle for _AUTH_TTL seconds by
+# the account's single timer in _EXPIRY_TIMERS.
+# _AUTH_LOCK only guards the dicts; logging in, checking and closing an
+# account's browsers happens under that account's lock in _KEY_LOCKS, so calls
+# for other accounts are not held up.
+_AUTH_TTL = 900
+_AUTH_CACHE: Dict[str, Tuple["BrowserManagerPool", str, float]] = {}
+_AUTH_LOCK = threading.Lock()
+_KEY_LOCKS: Dict[str, threading.Lock] = {}
+_EXPIRY_TIMERS: Dict[str, threading.Timer] = {}
+
+
+def _credentials_key(email: str, password: str) -> str:
+    return hashlib.sha256(f"{email}:{password}".encode()).hexdigest()
+
+
+def _session_alive(browser_pool: "BrowserManagerPool") -> Optional[bool]:
+    """
+    Whether an idle browser of the pool is still logged in to LinkedIn.
+
+    Returns None when every browser is busy serving another call, so there is
+    none to check.
+    """
+    try:
+        browser_manager = browser_pool.acquire(timeout=0)
+    except TimeoutError:
+        return None
+    try:
+        driver = browser_manager.driver
+        current_url = driver.current_url
+        if "linkedin.com" not in current_url or "/login" in current_url:
+            return False
+
+        # LinkedIn drops the session cookie when it ends the session
+        session_cookie = driver.get_cookie("li_at")
+        return (
+            bool(session_cookie)
+            and session_cookie.get("expiry", float("inf")) > time.time()
+        )
+    except Exception:
+        return False
+    finally:
+        browser_pool.release(browser_manager)
+
+
+def _key_lock(key: str) -> threading.Lock:
+    with _AUTH_LOCK:
+        return _KEY_LOCKS.setdefault(key, threading.Lock())
+
+
+def _get_browser_pool(email: str, password: str, size: int = 1) -> "BrowserManagerPool":
+    """
+    Return the cached authenticated browsers for an account, logging in if needed.
+
+    A pool whose session has been checked is grown to at least `size`
+    browsers, so a search only starts the one browser it uses and applying adds
+    the rest when needed.
+    """
+    from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
+
+    if not email or not password:
+        raise ValueError("Email and password are required in user_credentials")
+
+    key = _credentials_key(email, password)
+    with _key_lock(key):
+        with _AUTH_LOCK:
+            cached = _AUTH_CACHE.pop(key, None)
+        if cached:
+            browser_pool, _, last_used = cached
+            alive = _session_alive(browser_pool)
+            if alive is None or (alive and time.monotonic() - last_used < _AUTH_TTL):
+                # A pool whose session could not be checked is shared as is:
+                # it is not grown and its idle time keeps counting until a
+                # check succeeds
+                try:
+                    if alive:
+                        last_used = time.monotonic()
+                        browser_pool.grow(size, email, password)
+                finally:
+                    # The logged-in browsers stay usable if growing failed
+                    with _AUTH_LOCK:
+                        _AUTH_CACHE[key] = (browser_pool, email, last_used)
+                return browser_pool
+            with _AUTH_LOCK:
+                _cancel_expiry(key)
+            browser_pool.stop()
+
+        browser_pool = BrowserManagerPool.authenticated(size, email, password)
+        with _AUTH_LOCK:
+            _AUTH_CACHE[key] = (browser_pool, email, time.monotonic())
+        _schedule_expiry(key, _AUTH_TTL)
+        return browser_pool
+
+
+def _schedule_expiry(key: str, delay: float) -> None:
+    """(Re)arm the idle timer of an account, replacing any earlier one."""
+    timer = threading.Timer(delay, _expire_session, args=(key,))
+    timer.daemon = True
+    with _AUTH_LOCK:
+        previous = _EXPIRY_TIMERS.get(key)
+        _EXPIRY_TIMERS[key] = timer
+    if previous:
+        previous.cancel()
+    timer.start()
+
+
+def _cancel_expiry(key: str) -> None:
+    """Stop the idle timer of an account. The caller holds _AUTH_LOCK."""
+    timer = _EXPIRY_TIMERS.pop(key, None)
+    if timer:
+        timer.cancel()
+
+
+def _expire_session(key: str) -> None:
+    """Close cached browsers that have been idle for _AUTH_TTL seconds."""
+    with _AUTH_LOCK:
+        # Only the account's current timer acts; one replaced after it had
+        # already fired just ends
+        if _EXPIRY_TIMERS.get(key) is not threading.current_thread():
+            return
+    key_lock = _key_lock(key)
+    if not key_lock.acquire(blocking=False):
+        # A call is checking or logging in this account right now
+        _schedule_expiry(key, _AUTH_TTL)
+        return
+    try:
+        with _AUTH_LOCK:
+            cached = _AUTH_CACHE.get(key)
+            if not cached:
+                return
+
+            browser_pool, _, last_used = cached
+            idle_for = time.monotonic() - last_used
+            if idle_for < _AUTH_TTL:
+                # Used again since the timer was set
+                delay = _AUTH_TTL - idle_for
+            elif browser_pool.in_use():
+                # Still serving a long call
+                delay = _AUTH_TTL
+            else:
+                delay = None
+                del _AUTH_CACHE[key]
+                _cancel_expiry(key)
+
+        if delay is not None:
+            _schedule_expiry(key, delay)
+        else:
+            browser_pool.stop()
+    finally:
+        key_lock.release()
+
+
+def invalidate(email: str) -> None:
+    """Close and forget the cached browsers of an account, e.g. on logout."""
+    with _AUTH_LOCK:
+        browser_pools = []
+        for key, (browser_pool, cached_email, _) in list(_AUTH_CACHE.items()):
+            if cached_email == email:
+                del _AUTH_CACHE[key]
+                _cancel_expiry(key)
+                browser_pools.append(browser_pool)
+    for browser_pool in browser_pools:
+        browser_pool.stop()
+
+
+@atexit.register
+def _close_cached_sessions() -> None:
+    with _AUTH_LOCK:
+        browser_pools = [browser_pool for browser_pool, _, _ in _AUTH_CACHE.values()]
+        _AUTH_CACHE.clear()
+        for key in list(_EXPIRY_TIMERS):
+            _cancel_expiry(key)
+    for browser_pool in browser_pools:
+        browser_pool.stop()
+
+
+def _report_progress(ctx: Context, progress: float, total: float, message: str):
+    """Send an MCP progress notification from a worker thread."""
+    anyio.from_thread.run(partial(ctx.report_progress, progress, total, message))
 
 
 @mcp.tool
-def search_jobs(
+async def search_jobs(
     job_title: str,
     location: str,
     easy_apply: bool,
     email: str,
     password: str,
+    ctx: Context,
     limit: int = 50,
 ) -> list[JobResult]:
     """
@@ -66,17 +291,38 @@ def search_jobs(
     Returns:
         List of jobs with id_job and job_description
     """
-    return job_search_service.search_jobs(
-        job_title, location, easy_apply, email, password, limit
+    _configure_logging()
+    found = 0
+
+    def on_page(page_jobs: list[JobResult]) -> None:
+        # Report each results page as soon as it has been read
+        nonlocal found
+        found += len(page_jobs)
+        _report_progress(ctx, found, limit, f"Found {found} jobs")
+
+    # A search uses a single browser
+    browser_pool = await anyio.to_thread.run_sync(_get_browser_pool, email, password)
+    return await anyio.to_thread.run_sync(
+        partial(
+            _get_search_service().search_jobs,
+            job_title,
+            location,
+            limit,
+            {"email": email, "password": password},
+            easy_apply=easy_apply,
+            browser_pool=browser_pool,
+            on_page=on_page,
+        )
     )
 
 
 @mcp.tool
-def easy_apply_for_jobs(
+async def easy_apply_for_jobs(
     applications: list[ApplicationRequest],
     cv_analysis: CVAnalysis,
     email: str,
     password: str,
+    ctx: Context,
 ) -> list[ApplicationResult]:
     """
     Apply to multiple jobs using LinkedIn's easy apply feature with AI-powered form handling.
@@ -91,25 +337,54 @@ def easy_apply_for_jobs(
     Returns:
         List of application results with id_job, success status, and optional error message
     """
-    return job_application_service.apply_to_jobs(
-        applications, cv_analysis, {"email": email, "password": password}
-    )
+    _configure_logging()
+    try:
+        browser_pool = await anyio.to_thread.run_sync(
+            _get_browser_pool,
+            email,
+            password,
+            min(_get_application_service().browser_count, len(applications)),
+        )
+    except Exception as e:
+        return [
+            ApplicationResult(
+                id_job=application["job_id"],
+                success=False,
+                error=f"Application workflow failed: {str(e)}",
+            )
+            for application in applications
+        ]
 
+    finished = 0
 
-# Log registered tools
-log_mcp_tool_registration(
-    [
-        {"name": "search_jobs", "description": "Search LinkedIn jobs with filters"},
-        {
-            "name": "easy_apply_for_jobs",
-            "description": "Apply to jobs using Easy Apply with AI form handling",
-        },
-    ]
-)
+    def on_result(result: ApplicationResult) -> None:
+        # Report each application as soon as it has finished
+        nonlocal finished
+        finished += 1
+        status = "applied" if result["success"] else "failed"
+        _report_progress(
+            ctx, finished, len(applications), f"Job {result['id_job']}: {status}"
+        )
+
+    return await anyio.to_thread.run_sync(
+        partial(
+            _get_application_service().apply_to_jobs,
+            applications,
+            cv_analysis,
+            {"email": email, "password": password},
+            browser_pool=browser_pool,
+            on_result=on_result,
+        )
+    )
 
 
 if __name__ == "__main__":
     # For FastMCP, stdio is the standard MCP transport
     # TCP/HTTP servers are typically for development/testing
+    _configure_logging()
     print("Starting LinkedIn MCP Server with stdio transport")
-    mcp.run()
+
+    # Tool calls run their browser work in worker threads, so the event loop
+    # only handles MCP messages; uvloop makes that cheaper when it is installed
+    use_uvloop = importlib.util.find_spec("uvloop") is not None
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": use_uvloop})
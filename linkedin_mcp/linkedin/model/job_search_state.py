@@ -1,4 +1,5 @@
-from typing import List, Optional, TypedDict
+import operator
+from typing import Annotated, List, Optional, Set, TypedDict
 
 from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 from linkedin_mcp.linkedin.model.types import JobResult
@@ -11,7 +12,15 @@ class JobSearchState(TypedDict):
     limit: int
     browser_manager: IBrowserManager
     current_page: int
-    collected_jobs: List[JobResult]
+    # Nodes return only new entries; LangGraph appends them via the reducer
+    collected_jobs: Annotated[List[JobResult], operator.add]
+    # LinkedIn repeats jobs across pages; IDs already collected are skipped
+    seen_job_ids: Annotated[Set[int], operator.or_]
     search_url: Optional[str]
-    total_found: int
-    errors: List[str]
+    # Results endpoint paging: cards fetched so far, and jobs the last fetched
+    # page added
+    api_url: Optional[str]
+    api_offset: int
+    api_page_jobs: int
+    total_found: Annotated[int, operator.add]
+    errors: Annotated[List[str], operator.add]
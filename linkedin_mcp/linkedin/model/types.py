@@ -37,3 +37,4 @@ class AuthState(TypedDict):
     password: str
     browser_manager: Any
     authenticated: bool
+    error: str
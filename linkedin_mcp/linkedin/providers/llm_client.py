@@ -1,9 +1,11 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
 
 
+@lru_cache(maxsize=None)
 def get_llm_client(
     model_name: str = "Qwen/Qwen3-30B-A3B-Thinking-2507",
 ) -> ChatHuggingFace:
@@ -14,7 +16,8 @@ def get_llm_client(
         model_name: The model name to use (defaults to Qwen3-30B-A3B-Thinking)
 
     Returns:
-        Configured ChatHuggingFace client pointing to HF Serverless API
+        Configured ChatHuggingFace client pointing to HF Serverless API.
+        The client is created once per model name and shared by every caller.
     """
     load_dotenv()
     hf_token = os.getenv("HUGGING_FACE_HUB_TOKEN")
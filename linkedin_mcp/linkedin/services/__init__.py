@@ -1,6 +1,7 @@
 from linkedin_mcp.linkedin.services.browser_manager_service import (
     BrowserManagerService as BrowserManager,
 )
+from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
 from linkedin_mcp.linkedin.services.job_application_service import JobApplicationService
 from linkedin_mcp.linkedin.services.job_search_service import JobSearchService
 from linkedin_mcp.linkedin.services.linkedin_auth_service import LinkedInAuthService
@@ -9,5 +10,6 @@ __all__ = [
     "JobSearchService",
     "JobApplicationService",
     "BrowserManager",
+    "BrowserManagerPool",
     "LinkedInAuthService",
 ]
@@ -1,9 +1,21 @@
+import os
+import random
+import shutil
+import socket
+import threading
 import time
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Set
 
 import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -13,15 +25,180 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 
+# Chrome profiles kept between runs so LinkedIn's scripts and static assets are
+# served from the HTTP and code caches instead of being downloaded and compiled
+# again. They also hold session cookies, so they are owner-only and each one
+# belongs to a single account.
+CHROME_PROFILE_ROOT = Path(
+    os.getenv(
+        "LINKEDIN_MCP_CHROME_PROFILE_DIR",
+        Path.home() / ".cache" / "linkedin_mcp" / "chrome-profiles",
+    )
+).expanduser()
+
+# Poll interval for the page and element waits below. Elements usually appear
+# within tens of milliseconds, well inside WebDriverWait's 500ms default.
+_POLL_FREQUENCY = 0.05
+
+# Misses the shared waits below expect while a page is still rendering
+_IGNORED_WAIT_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Requests the automation never needs: images, fonts and tracking. Blocked
+# through CDP since Chrome ignores the old --disable-images switch.
+_BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*/li/track*",
+    "*.doubleclick.net/*",
+    "*.google-analytics.com/*",
+]
+
+# Calls back with the first element matching a CSS selector as soon as it is
+# added to the page, or with null after a timeout. Watching DOM mutations in the
+# page answers in one WebDriver round trip instead of polling over the wire.
+WAIT_FOR_SELECTOR_SCRIPT = """
+const [selector, timeoutMs, done] = arguments;
+const found = document.querySelector(selector);
+if (found) return done(found);
+const observer = new MutationObserver(() => {
+    const element = document.querySelector(selector);
+    if (element) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(element);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+observer.observe(document.documentElement, { childList: true, subtree: true });
+"""
+
+# Installed once per session through CDP, so every document LinkedIn loads
+# starts with the helpers defined and the webdriver flag hidden. setValue sets
+# an input's value in one WebDriver call instead of one key event per
+# character, firing the events forms listen for. The prototype's setter is
+# used so frameworks tracking the value see the change.
+PAGE_HELPERS_SCRIPT = """
+window.__mcp = {
+  setValue(field, value) {
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(field), "value").set;
+    setter.call(field, value);
+    field.dispatchEvent(new Event("input", { bubbles: true }));
+    field.dispatchEvent(new Event("change", { bubbles: true }));
+  },
+};
+try {
+  Object.defineProperty(navigator, "webdriver", { get: () => undefined });
+} catch (e) {}
+"""
+
+SET_INPUT_VALUE_SCRIPT = "window.__mcp.setValue(arguments[0], arguments[1]);"
+
+
+def _profile_locked(profile_dir: Path) -> bool:
+    """
+    Whether a running Chrome has a profile directory open.
+
+    Chrome's SingletonLock is a symlink to "<hostname>-<pid>". A lock left by a
+    Chrome of this host that is no longer running is removed, so the profile
+    can be used again.
+    """
+    lock = profile_dir / "SingletonLock"
+    try:
+        target = os.readlink(lock)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
+
+    host, _, pid = target.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        pass
+    except PermissionError:
+        return True
+    else:
+        return True
+
+    for name in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+        (profile_dir / name).unlink(missing_ok=True)
+    return False
+
+
+@lru_cache(maxsize=None)
+def _chromedriver_path() -> str:
+    """
+    Resolve chromedriver once per process instead of on every browser start.
+
+    A chromedriver on PATH is used as is; otherwise webdriver-manager downloads
+    one matching the installed Chrome.
+    """
+    return shutil.which("chromedriver") or ChromeDriverManager().install()
+
+
+@lru_cache(maxsize=None)
+def _user_agents() -> UserAgent:
+    """Load the user agent database once per process."""
+    return UserAgent()
+
 
 class BrowserManagerService(IBrowserManager):
     """Manages browser instances for LinkedIn automation."""
 
-    def __init__(self, headless: bool = False, use_undetected: bool = True):
+    # Patched chromedriver left by the first undetected browser start of the
+    # process; later starts reuse it instead of downloading and patching again
+    _uc_driver_path: Optional[str] = None
+    _uc_version_main: Optional[int] = None
+
+    # A profile can only be open in one Chrome at a time; browsers of this
+    # process claim one each, and profiles locked by other running Chromes are
+    # skipped
+    _profiles_lock = threading.Lock()
+    _profiles_in_use: Set[Path] = set()
+
+    # Chrome switches shared by every browser
+    _STATIC_ARGS = (
+        # Anti-detection options
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        # Performance options
+        "--disable-extensions",
+        "--disable-plugins",
+    )
+
+    def __init__(
+        self,
+        headless: bool = False,
+        use_undetected: bool = True,
+        human_delays: Optional[bool] = None,
+        persistent_profile: bool = True,
+    ):
         self.headless = headless
         self.use_undetected = use_undetected
+        self.persistent_profile = persistent_profile
+        self.profile_dir: Optional[Path] = None
+        # Seconds-long pauses between workflow steps are opt-in; they make the
+        # session look more human but add nothing once pages have loaded
+        if human_delays is None:
+            human_delays = (
+                os.getenv("LINKEDIN_MCP_HUMAN_DELAYS", "false").lower() == "true"
+            )
+        self.human_delays = human_delays
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        self.fast_wait: Optional[WebDriverWait] = None
 
     def _get_chrome_options(self) -> Options:
         """Configure Chrome options for LinkedIn automation."""
@@ -30,40 +207,103 @@ class BrowserManagerService(IBrowserManager):
         if self.headless:
             options.add_argument("--headless")
 
-        # Anti-detection options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.arguments.extend(self._STATIC_ARGS)
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
 
-        # Performance options
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")
-
         # User agent
-        ua = UserAgent()
-        options.add_argument(f"--user-agent={ua.random}")
+        options.add_argument(f"--user-agent={_user_agents().random}")
+
+        if self.profile_dir:
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+            options.add_argument("--profile-directory=Default")
+            options.add_argument("--disk-cache-size=200000000")
 
         return options
 
-    def start_browser(self) -> webdriver.Chrome:
-        """Start and configure the browser."""
-        options = self._get_chrome_options()
+    @classmethod
+    def _claim_profile_dir(cls, profile_name: str) -> Path:
+        """Reserve the first profile directory of `profile_name` no browser uses."""
+        with cls._profiles_lock:
+            CHROME_PROFILE_ROOT.mkdir(mode=0o700, parents=True, exist_ok=True)
+            slot = 0
+            while True:
+                profile_dir = (
+                    CHROME_PROFILE_ROOT / f"chrome-profile-{profile_name}-{slot}"
+                )
+                if profile_dir not in cls._profiles_in_use and not _profile_locked(
+                    profile_dir
+                ):
+                    cls._profiles_in_use.add(profile_dir)
+                    return profile_dir
+                slot += 1
+
+    def _release_profile_dir(self) -> None:
+        if self.profile_dir:
+            with self._profiles_lock:
+                self._profiles_in_use.discard(self.profile_dir)
+            self.profile_dir = None
 
-        if self.use_undetected:
-            self.driver = uc.Chrome(options=options)
-        else:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+    def start_browser(self, profile_name: Optional[str] = None) -> webdriver.Chrome:
+        """
+        Start and configure the browser.
 
-        # Remove webdriver property
-        self.driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        Args:
+            profile_name: Account the browser is started for, as returned by
+                LinkedInAuthService.session_key(). A persistent profile is only
+                used when it is given, so browsers never share a LinkedIn login
+                across accounts.
+        """
+        if self.persistent_profile and profile_name:
+            self.profile_dir = self._claim_profile_dir(profile_name)
+
+        try:
+            options = self._get_chrome_options()
+
+            if self.use_undetected:
+                cls = type(self)
+                self.driver = uc.Chrome(
+                    options=options,
+                    driver_executable_path=cls._uc_driver_path,
+                    version_main=cls._uc_version_main,
+                )
+                cls._uc_driver_path = self.driver.patcher.executable_path
+                cls._uc_version_main = self.driver.patcher.version_main
+            else:
+                service = Service(
+                    _chromedriver_path(), service_args=["--log-level=OFF"]
+                )
+                self.driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            self._release_profile_dir()
+            raise
+
+        # Skip downloading assets; the setting lasts for the whole session
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS}
         )
 
-        self.wait = WebDriverWait(self.driver, 10)
+        # Define the page helpers in every new document, and in the blank page
+        # already open
+        self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": PAGE_HELPERS_SCRIPT}
+        )
+        self.driver.execute_script(PAGE_HELPERS_SCRIPT)
+
+        self.wait = WebDriverWait(
+            self.driver,
+            10,
+            poll_frequency=0.1,
+            ignored_exceptions=_IGNORED_WAIT_EXCEPTIONS,
+        )
+        # For short waits on elements of a page that has already loaded
+        self.fast_wait = WebDriverWait(
+            self.driver,
+            5,
+            poll_frequency=_POLL_FREQUENCY,
+            ignored_exceptions=_IGNORED_WAIT_EXCEPTIONS,
+        )
         return self.driver
 
     def close_browser(self):
@@ -72,6 +312,8 @@ class BrowserManagerService(IBrowserManager):
             self.driver.quit()
             self.driver = None
             self.wait = None
+            self.fast_wait = None
+        self._release_profile_dir()
 
     # Interface methods
     def get_driver(self):
@@ -89,7 +331,7 @@ class BrowserManagerService(IBrowserManager):
         self.driver.get(job_url)
 
         # Wait for page to load
-        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "main")))
+        self.wait_for_css("main")
 
     def cleanup(self) -> None:
         """Clean up browser resources."""
@@ -101,25 +343,76 @@ class BrowserManagerService(IBrowserManager):
             raise RuntimeError("Browser not started. Call start_browser() first.")
 
         self.driver.get("https://www.linkedin.com")
-        time.sleep(2)
+        self.wait_for_page_idle()
 
     def wait_for_element(self, by: By, value: str, timeout: int = 10):
         """Wait for an element to be present."""
         if not self.wait:
             raise RuntimeError("Browser not started. Call start_browser() first.")
 
-        return self.wait.until(EC.presence_of_element_located((by, value)))
+        return WebDriverWait(
+            self.driver, timeout, poll_frequency=_POLL_FREQUENCY
+        ).until(EC.presence_of_element_located((by, value)))
 
     def wait_for_clickable(self, by: By, value: str, timeout: int = 10):
         """Wait for an element to be clickable."""
         if not self.wait:
             raise RuntimeError("Browser not started. Call start_browser() first.")
 
-        return self.wait.until(EC.element_to_be_clickable((by, value)))
+        return WebDriverWait(
+            self.driver, timeout, poll_frequency=_POLL_FREQUENCY
+        ).until(EC.element_to_be_clickable((by, value)))
+
+    def wait_for_css(self, selector: str, timeout: float = 10):
+        """
+        Wait for an element matching a CSS selector to be present.
+
+        Must not span a page load, which aborts the in-page wait.
+
+        Raises:
+            TimeoutException: If no element matches within `timeout` seconds.
+        """
+        if not self.driver:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+
+        element = self.driver.execute_async_script(
+            WAIT_FOR_SELECTOR_SCRIPT, selector, int(timeout * 1000)
+        )
+        if element is None:
+            raise TimeoutException(f"No element matching {selector!r} after {timeout}s")
+        return element
+
+    def wait_for_page_idle(self, timeout: float = 10) -> None:
+        """Wait until the current document has finished loading."""
+        if not self.driver:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+
+        WebDriverWait(self.driver, timeout, poll_frequency=_POLL_FREQUENCY).until(
+            lambda driver: driver.execute_script("return document.readyState")
+            == "complete"
+        )
+
+    def set_input_value(self, element, value: str) -> None:
+        """Replace the value of a text input or textarea in a single call."""
+        if not self.driver:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+
+        self.driver.execute_script(SET_INPUT_VALUE_SCRIPT, element, value)
 
     def random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
         """Add random delay to mimic human behavior."""
-        import random
-
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
+
+    def micro_jitter(self, a_ms: float = 100, b_ms: float = 300):
+        """
+        Pause briefly between workflow steps.
+
+        Falls back to random_delay() when human delays are enabled through
+        LINKEDIN_MCP_HUMAN_DELAYS.
+        """
+        if self.human_delays:
+            self.random_delay()
+            return
+
+        time.sleep(random.uniform(a_ms, b_ms) / 1000)
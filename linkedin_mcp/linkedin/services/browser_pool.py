@@ -0,0 +1,153 @@
+import queue
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from loguru import logger
+
+from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
+from linkedin_mcp.linkedin.services.browser_manager_service import (
+    BrowserManagerService as BrowserManager,
+)
+from linkedin_mcp.linkedin.services.linkedin_auth_service import LinkedInAuthService
+
+
+class BrowserManagerPool:
+    """
+    Fixed set of authenticated browsers shared by concurrent workflows.
+
+    WebDriver sessions are not thread-safe, so a browser is handed to one caller
+    at a time: acquire() blocks until one is idle and release() returns it.
+    """
+
+    def __init__(self, browser_managers: List[IBrowserManager]):
+        self._browser_managers = list(browser_managers)
+        self._idle: queue.Queue = queue.Queue()
+        for browser_manager in self._browser_managers:
+            self._idle.put(browser_manager)
+
+    @classmethod
+    def authenticated(
+        cls,
+        size: int,
+        email: str,
+        password: str,
+        auth_service: Optional[LinkedInAuthService] = None,
+        browser_factory: Callable[[], IBrowserManager] = BrowserManager,
+        trace_id: str = "unknown",
+    ) -> "BrowserManagerPool":
+        """
+        Start and authenticate `size` browsers.
+
+        The first login saves the session cookies of the account, which the
+        auth service then restores in the other browsers instead of logging
+        each of them in.
+
+        Raises:
+            Exception: If a browser cannot be authenticated. Browsers started so
+                far are closed first.
+        """
+        return cls(
+            cls._start_authenticated(
+                max(1, size), email, password, auth_service, browser_factory, trace_id
+            )
+        )
+
+    def grow(
+        self,
+        size: int,
+        email: str,
+        password: str,
+        auth_service: Optional[LinkedInAuthService] = None,
+        browser_factory: Callable[[], IBrowserManager] = BrowserManager,
+        trace_id: str = "unknown",
+    ) -> None:
+        """
+        Start and authenticate browsers until the pool has `size` of them.
+
+        Raises:
+            Exception: If a browser cannot be authenticated. The browsers
+                started by this call are closed; the pool keeps its others.
+        """
+        for browser_manager in self._start_authenticated(
+            size - len(self), email, password, auth_service, browser_factory, trace_id
+        ):
+            self._browser_managers.append(browser_manager)
+            self._idle.put(browser_manager)
+
+    @staticmethod
+    def _start_authenticated(
+        count: int,
+        email: str,
+        password: str,
+        auth_service: Optional[LinkedInAuthService],
+        browser_factory: Callable[[], IBrowserManager],
+        trace_id: str,
+    ) -> List[IBrowserManager]:
+        auth_service = auth_service or LinkedInAuthService()
+        browser_managers: List[IBrowserManager] = []
+
+        try:
+            for _ in range(count):
+                browser_manager = browser_factory()
+                browser_managers.append(browser_manager)
+
+                logger.info("Initializing browser", trace_id=trace_id)
+                browser_manager.start_browser(auth_service.session_key(email))
+
+                logger.info(
+                    "Authenticating with LinkedIn", trace_id=trace_id, email=email
+                )
+                auth_result = auth_service.authenticate(
+                    email, password, browser_manager
+                )
+                if not auth_result["authenticated"]:
+                    raise Exception(
+                        f"Authentication failed: {auth_result.get('error', 'Unknown error')}"
+                    )
+
+        except Exception:
+            for browser_manager in browser_managers:
+                browser_manager.cleanup()
+            raise
+
+        return browser_managers
+
+    def __len__(self) -> int:
+        return len(self._browser_managers)
+
+    def in_use(self) -> bool:
+        """Whether any browser is currently checked out."""
+        return self._idle.qsize() < len(self._browser_managers)
+
+    def acquire(self, timeout: Optional[float] = None) -> IBrowserManager:
+        """
+        Check out an idle browser, waiting for one to be released if needed.
+
+        Raises:
+            TimeoutError: If no browser becomes idle within `timeout` seconds.
+        """
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser became available within {timeout}s")
+
+    def release(self, browser_manager: IBrowserManager) -> None:
+        """Return a browser checked out with acquire()."""
+        self._idle.put(browser_manager)
+
+    @contextmanager
+    def browser(self, timeout: Optional[float] = None) -> Iterator[IBrowserManager]:
+        """Check out a browser for the duration of a with block."""
+        browser_manager = self.acquire(timeout)
+        try:
+            yield browser_manager
+        finally:
+            self.release(browser_manager)
+
+    def stop(self) -> None:
+        """Close every browser in the pool."""
+        for browser_manager in self._browser_managers:
+            try:
+                browser_manager.cleanup()
+            except Exception as e:
+                logger.warning("Failed to close browser", error=str(e))
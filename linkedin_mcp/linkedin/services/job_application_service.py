@@ -1,5 +1,6 @@
+import os
 import uuid
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from loguru import logger
 
@@ -15,13 +16,20 @@ from linkedin_mcp.linkedin.observability.langfuse_config import create_mcp_trace
 from linkedin_mcp.linkedin.services.browser_manager_service import (
     BrowserManagerService as BrowserManager,
 )
+from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
 from linkedin_mcp.linkedin.services.linkedin_auth_service import LinkedInAuthService
 
 
 class JobApplicationService(IJobApplicationService):
     """Service responsible for orchestrating complete LinkedIn job application workflow."""
 
-    def __init__(self):
+    def __init__(self, browser_count: Optional[int] = None):
+        # Number of browsers used to apply concurrently; each processes one
+        # application at a time
+        if browser_count is None:
+            browser_count = int(os.getenv("APPLY_CONCURRENCY", "4"))
+        self.browser_count = max(1, browser_count)
+
         # Create concrete implementations
         self.browser_manager = BrowserManager()
         self.job_application_agent = EasyApplyAgent()
@@ -38,6 +46,8 @@ class JobApplicationService(IJobApplicationService):
         applications: List[ApplicationRequest],
         cv_analysis: CVAnalysis,
         user_credentials: Dict[str, str],
+        browser_pool: Optional[BrowserManagerPool] = None,
+        on_result: Optional[Callable[[ApplicationResult], None]] = None,
     ) -> List[ApplicationResult]:
         """
         Apply to multiple jobs using LinkedIn's easy apply with AI-powered form handling.
@@ -46,6 +56,11 @@ class JobApplicationService(IJobApplicationService):
             applications: List of application requests with job_id and monthly_salary
             cv_analysis: Structured CV analysis data for AI form filling
             user_credentials: User authentication credentials (email, password)
+            browser_pool: Already authenticated browsers to apply with. They are
+                left open for the caller; without a pool, browsers are started,
+                authenticated and closed for this call.
+            on_result: Called with each application's result as soon as it
+                finishes, in completion order
 
         Returns:
             List of application results with id_job, success status, and optional error message
@@ -80,37 +95,35 @@ class JobApplicationService(IJobApplicationService):
             logger.error("Invalid credentials", trace_id=trace_id, error=error_msg)
             raise ValueError(error_msg)
 
+        owns_pool = browser_pool is None
         try:
-            # Step 1: Initialize browser (use injected dependency)
-            logger.info("Initializing browser", trace_id=trace_id)
-            self.browser_manager.start_browser()
-
-            # Step 2: Authenticate with LinkedIn
-            logger.info("Authenticating with LinkedIn", trace_id=trace_id, email=email)
-            auth_result = self.auth_service.authenticate(
-                email, password, self.browser_manager
-            )
-
-            if not auth_result["authenticated"]:
-                raise Exception(
-                    f"Authentication failed: {auth_result.get('error', 'Unknown error')}"
+            # Step 1 and 2: Start and authenticate the browsers. Extra browsers
+            # only pay off when there is more than one application.
+            if owns_pool:
+                browser_pool = BrowserManagerPool.authenticated(
+                    min(self.browser_count, len(applications)),
+                    email,
+                    password,
+                    auth_service=self.auth_service,
+                    trace_id=trace_id,
                 )
 
             # Step 3: Execute job application workflow with AI form handling
             logger.info("Starting job application graph execution", trace_id=trace_id)
             raw_results = self.application_graph.execute(
-                applications, cv_analysis, self.browser_manager, trace_id=trace_id
+                applications,
+                cv_analysis,
+                trace_id=trace_id,
+                browser_pool=browser_pool,
+                on_result=(
+                    (lambda result: on_result(self._to_application_result(result)))
+                    if on_result
+                    else None
+                ),
             )
 
             # Step 4: Convert to ApplicationResult format
-            return [
-                ApplicationResult(
-                    id_job=result["job_id"],
-                    success=result["success"],
-                    error=result.get("error"),
-                )
-                for result in raw_results
-            ]
+            return [self._to_application_result(result) for result in raw_results]
 
         except Exception as e:
             # Return error results for all jobs
@@ -125,5 +138,14 @@ class JobApplicationService(IJobApplicationService):
 
         finally:
             # Step 5: Cleanup browser resources
-            if self.browser_manager:
-                self.browser_manager.close_browser()
+            if owns_pool and browser_pool is not None:
+                browser_pool.stop()
+
+    @staticmethod
+    def _to_application_result(result: dict) -> ApplicationResult:
+        """Convert a raw graph result to the ApplicationResult returned to callers."""
+        return ApplicationResult(
+            id_job=result["job_id"],
+            success=result["success"],
+            error=result.get("error"),
+        )
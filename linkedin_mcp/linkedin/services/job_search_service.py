@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from linkedin_mcp.linkedin.graphs.job_search_graph_impl import JobSearchGraph
 from linkedin_mcp.linkedin.interfaces.services import IJobSearchService
@@ -6,6 +6,7 @@ from linkedin_mcp.linkedin.model.types import JobResult
 from linkedin_mcp.linkedin.services.browser_manager_service import (
     BrowserManagerService as BrowserManager,
 )
+from linkedin_mcp.linkedin.services.browser_pool import BrowserManagerPool
 from linkedin_mcp.linkedin.services.linkedin_auth_service import LinkedInAuthService
 
 
@@ -26,6 +27,9 @@ class JobSearchService(IJobSearchService):
         location: str,
         limit: int,
         user_credentials: Dict[str, str],
+        easy_apply: bool = True,
+        browser_pool: Optional[BrowserManagerPool] = None,
+        on_page: Optional[Callable[[List[JobResult]], None]] = None,
     ) -> List[JobResult]:
         """
         Search for jobs on LinkedIn - handles authentication and search workflow.
@@ -35,6 +39,10 @@ class JobSearchService(IJobSearchService):
             location: The location to search in
             limit: Maximum number of jobs to collect
             user_credentials: User authentication credentials (email, password)
+            easy_apply: Whether to filter for Easy Apply jobs only
+            browser_pool: Already authenticated browsers to search with. The
+                search borrows one and leaves it open for the caller.
+            on_page: Called with the jobs of each results page as it is read
 
         Returns:
             List of jobs with id_job and job_description
@@ -46,9 +54,23 @@ class JobSearchService(IJobSearchService):
         if not email or not password:
             raise ValueError("Email and password are required in user_credentials")
 
+        if browser_pool is not None:
+            try:
+                with browser_pool.browser() as browser_manager:
+                    return self.search_graph.execute(
+                        job_title,
+                        location,
+                        easy_apply,
+                        limit,
+                        browser_manager,
+                        on_page=on_page,
+                    )
+            except Exception as e:
+                raise Exception(f"Job search failed: {str(e)}")
+
         try:
             # Step 1: Initialize browser (use injected dependency)
-            self.browser_manager.start_browser()
+            self.browser_manager.start_browser(self.auth_service.session_key(email))
 
             # Step 2: Authenticate with LinkedIn
             auth_result = self.auth_service.authenticate(
@@ -64,9 +86,10 @@ class JobSearchService(IJobSearchService):
             raw_results = self.search_graph.execute(
                 job_title,
                 location,
-                True,
+                easy_apply,
                 limit,
-                self.browser_manager,  # Default to easy_apply=True
+                self.browser_manager,
+                on_page=on_page,
             )
 
             # Step 4: Return job results (already in JobResult format)
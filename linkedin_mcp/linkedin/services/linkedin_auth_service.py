@@ -1,9 +1,31 @@
-from selenium.webdriver.common.by import By
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
 
 from linkedin_mcp.linkedin.graphs.linkedin_auth_graph import LinkedInAuthGraph
 from linkedin_mcp.linkedin.interfaces.services import IBrowserManager
 from linkedin_mcp.linkedin.model.types import AuthState
 
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+
+# Session cookies of the last login per account, so a new browser can skip the
+# login flow. The files grant access to the account and are owner-only.
+COOKIE_CACHE_DIR = Path.home() / ".cache" / "linkedin_mcp"
+
+# On a LinkedIn page other than the login page, user-specific elements mean the
+# session is logged in. Checked in one WebDriver call.
+IS_AUTHENTICATED_SCRIPT = """
+const url = location.href;
+if (!url.includes("linkedin.com") || url.includes("/login")) return false;
+return !!document.querySelector(
+  '[data-test-id="nav-top-profile"], input[aria-label*="Search job"]'
+);
+"""
+
 
 class LinkedInAuthService:
     """Service for LinkedIn authentication."""
@@ -17,6 +39,9 @@ class LinkedInAuthService:
         """
         Authenticate with LinkedIn using provided credentials.
 
+        The session cookies saved by the last login of this account are tried
+        first; the login flow only runs when they are missing or expired.
+
         Args:
             email: LinkedIn email
             password: LinkedIn password
@@ -25,7 +50,71 @@ class LinkedInAuthService:
         Returns:
             AuthState with authentication result
         """
-        return self.auth_graph.execute(email, password, browser_manager)
+        if self._restore_session(email, browser_manager):
+            return AuthState(
+                email=email,
+                password=password,
+                browser_manager=browser_manager,
+                authenticated=True,
+                error="",
+            )
+
+        result = self.auth_graph.execute(email, password, browser_manager)
+        if result["authenticated"]:
+            self._save_cookies(email, browser_manager.driver.get_cookies())
+        return result
+
+    def _restore_session(self, email: str, browser_manager: IBrowserManager) -> bool:
+        """Log a browser in with the saved session cookies of an account."""
+        cookies = self._load_cookies(email)
+        if not cookies:
+            return False
+
+        try:
+            driver = browser_manager.driver
+            # Cookies can only be set for the domain currently loaded
+            driver.get(LINKEDIN_FEED_URL)
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            driver.get(LINKEDIN_FEED_URL)
+            if self.is_authenticated(browser_manager):
+                return True
+        except Exception as e:
+            logger.debug("Could not reuse LinkedIn session cookies", error=str(e))
+
+        # The session has expired or was revoked
+        self._cookie_file(email).unlink(missing_ok=True)
+        return False
+
+    @staticmethod
+    def session_key(email: str) -> str:
+        """Stable file-name-safe key of an account for its cached session data."""
+        return hashlib.sha256(email.encode()).hexdigest()[:16]
+
+    @classmethod
+    def _cookie_file(cls, email: str) -> Path:
+        return COOKIE_CACHE_DIR / f"cookies_{cls.session_key(email)}.json"
+
+    @classmethod
+    def _load_cookies(cls, email: str) -> Optional[List[dict]]:
+        """Session cookies saved by the last login of an account, if any."""
+        try:
+            return json.loads(cls._cookie_file(email).read_text())
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _save_cookies(cls, email: str, cookies: List[dict]) -> None:
+        """Persist session cookies readable by the current user only."""
+        try:
+            COOKIE_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cookie_file = cls._cookie_file(email)
+            fd = os.open(cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(cookies, f)
+            os.chmod(cookie_file, 0o600)
+        except OSError as e:
+            logger.warning("Could not save LinkedIn session cookies", error=str(e))
 
     def is_authenticated(self, browser_manager: IBrowserManager) -> bool:
         """
@@ -42,26 +131,7 @@ class LinkedInAuthService:
             if not driver:
                 return False
 
-            current_url = driver.current_url
-
-            # Check if we're on a LinkedIn page that requires authentication
-            if "linkedin.com" in current_url and "/login" not in current_url:
-                # Look for user-specific elements
-                try:
-                    driver.find_element(
-                        By.CSS_SELECTOR, '[data-test-id="nav-top-profile"]'
-                    )
-                    return True
-                except:
-                    try:
-                        driver.find_element(
-                            By.CSS_SELECTOR, 'input[aria-label*="Search job"]'
-                        )
-                        return True
-                    except:
-                        return False
-
-            return False
+            return bool(driver.execute_script(IS_AUTHENTICATED_SCRIPT))
 
         except Exception:
             return False
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 from typing import Any, Dict, List
 
@@ -119,8 +120,6 @@ class LinkedInMCPClient:
 
         # Parse JSON result if it's a string
         if isinstance(result, str):
-            import json
-
             result = json.loads(result)
 
         # Convert result to JobResult format
@@ -181,8 +180,6 @@ class LinkedInMCPClient:
 
         # Parse JSON result if it's a string
         if isinstance(result, str):
-            import json
-
             result = json.loads(result)
 
         # Convert result to ApplicationResult format
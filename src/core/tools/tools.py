@@ -1,3 +1,4 @@
+import json
 import os
 import re
 
@@ -102,8 +103,6 @@ def analyze_cv_structure(cv_text: str) -> CVAnalysis:
         response = chain.invoke({"cv_text": cv_text})
 
         # Parse the response (assuming it returns structured data)
-        import json
-
         # Clean the response text to extract JSON
         response_text = (
             response.content if hasattr(response, "content") else str(response)
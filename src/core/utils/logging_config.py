@@ -11,11 +11,17 @@ from loguru import logger
 # Load environment variables
 load_dotenv()
 
+# Settings of the last configure call, reused by later calls that leave them out
+# (e.g. the agent reconfiguring with its run's trace_id after the CLI chose the
+# level, log file and console output)
+_settings: dict = {}
+
 
 def configure_core_agent_logging(
     log_level: Optional[str] = None,
     log_file: Optional[str] = None,
     default_trace_id: Optional[str] = None,
+    console: Optional[bool] = None,
 ) -> None:
     """
     Configure logging for the core agent with structured output.
@@ -25,6 +31,8 @@ def configure_core_agent_logging(
         log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
         default_trace_id: Default trace_id for agent logs (defaults to UUID)
+        console: Whether to log to stderr (defaults to True). Turned off when
+            stdout/stderr carry other output, such as JSON or progress bars.
     """
     import uuid
 
@@ -32,10 +40,20 @@ def configure_core_agent_logging(
     logger.remove()
 
     # Get configuration from environment or parameters
-    log_level = log_level or os.getenv("CORE_AGENT_LOG_LEVEL", "INFO")
-    log_file = log_file or os.getenv("CORE_AGENT_LOG_FILE")
+    log_level = (
+        log_level
+        or _settings.get("log_level")
+        or os.getenv("CORE_AGENT_LOG_LEVEL", "INFO")
+    )
+    log_file = log_file or _settings.get("log_file") or os.getenv("CORE_AGENT_LOG_FILE")
+    if console is None:
+        console = _settings.get("console", True)
+    _settings.update(log_level=log_level, log_file=log_file, console=console)
     default_trace_id = default_trace_id or str(uuid.uuid4())
 
+    # Unbound loggers fall back to the default trace_id
+    logger.configure(extra={"trace_id": default_trace_id})
+
     # Console logging with rich colors - always includes trace_id
     console_format = (
         "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
@@ -46,15 +64,16 @@ def configure_core_agent_logging(
     )
 
     # Add console handler
-    logger.add(
-        sys.stderr,
-        format=console_format,
-        level=log_level,
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
-        enqueue=True,
-    )
+    if console:
+        logger.add(
+            sys.stderr,
+            format=console_format,
+            level=log_level,
+            colorize=True,
+            backtrace=True,
+            diagnose=True,
+            enqueue=True,
+        )
 
     # Add file handler if specified
     if log_file:
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test script to verify the CLI startup path does not import the agent graph."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# Modules that must stay off the `import cli` / `--help` path
+HEAVY_MODULES = ("src.core.agent", "langgraph", "langchain_core", "selenium")
+
+# Budget for the cumulative import time of the `cli` package, in microseconds
+CLI_IMPORT_BUDGET_US = 200_000
+
+
+def _import_times(*args: str) -> dict:
+    """Run python with -X importtime and return {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_is_lazy():
+    """`import cli` must not load heavy modules and must stay within budget."""
+    print("Testing `import cli` import budget...")
+
+    times = _import_times("-c", "import cli")
+    loaded = [m for m in times if m.startswith(HEAVY_MODULES)]
+
+    assert not loaded, f"heavy modules imported by `import cli`: {loaded}"
+    assert times.get("cli", 0) < CLI_IMPORT_BUDGET_US, (
+        f"`import cli` took {times.get('cli', 0)}us "
+        f"(budget {CLI_IMPORT_BUDGET_US}us)"
+    )
+
+    print("✅ `import cli` import budget test passed")
+
+
+def test_cli_help_does_not_import_agent():
+    """`job_applier.py --help` must not load the agent graph or its dependencies."""
+    print("Testing `job_applier.py --help` imports...")
+
+    times = _import_times("job_applier.py", "--help")
+    loaded = [m for m in times if m.startswith(HEAVY_MODULES)]
+
+    assert not loaded, f"heavy modules imported by `--help`: {loaded}"
+
+    print("✅ `--help` import test passed")
+
+
+if __name__ == "__main__":
+    print("Testing CLI import budget...")
+    print("=" * 60)
+
+    try:
+        test_cli_import_is_lazy()
+        print()
+        test_cli_help_does_not_import_agent()
+    except AssertionError as e:
+        print(f"❌ Import budget test failed: {e}")
+        sys.exit(1)
+
+    print("\n" + "=" * 60)
+    print("🎉 All import budget tests passed!")